@@ -1,28 +1,244 @@
-import requests
+import hashlib
 import json
+import os
+import time
+from collections import deque
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+
+BASE_URL = "https://v3.football.api-sports.io"
+CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / "cache"
+CACHE_TTL = 6 * 3600
+
+
+def write_json(path, obj):
+    """write to a temporary file and rename it, an interrupted run never leaves half a file"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f)
+    os.replace(tmp_path, path)
+
+
 def load_api():
     config_path = Path(__file__).resolve().parents[1] / "config" / "api_keys.json"
     with open(config_path) as f:
         return json.load(f)["api_football_key"]
-    
-API_KEY = load_api()
-BASE_URL = "https://v3.football.api-sports.io"
 
-HEADERS = {
-    "x-apisports-key": API_KEY
-}
+
+class APIFootballError(Exception):
+    def __init__(self, status_code, message):
+        self.status_code = status_code
+        self.message = f"Error {status_code}: {message}"
+        super().__init__(self.message)
+
+
+class QuotaExceeded(APIFootballError):
+    def __init__(self, remaining):
+        super().__init__(429, f"daily quota exhausted ({remaining} requests left)")
+
+
+class APIFootball:
+    """
+    API-Football client that spends the daily quota only on data it doesn't have
+
+    - one pooled session for every request
+    - responses cached on disk by endpoint and params, a cached request costs nothing
+    - remaining daily and per minute requests read from the response headers:
+      waits when the minute budget is spent and stops before the daily one is
+    - paginated endpoints are followed to the last page
+
+    Args:
+        api_key (str): API key, read from config/api_keys.json on the first request if None.
+        cache_dir (str | Path): Folder of the cached responses, no cache if None.
+        cache_ttl (float): Seconds a cached response of a current season (or without season)
+                           is valid, forever if None. Responses of past seasons don't change
+                           and are always kept for good.
+        reserve (int): Daily requests to keep unused, requests stop when only these are left.
+        timeout (float): Seconds to wait for a response.
+    """
+
+    def __init__(self, api_key=None, cache_dir=CACHE_DIR, cache_ttl=CACHE_TTL, reserve=0, timeout=30):
+        self._api_key = api_key
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.reserve = reserve
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+
+        self.daily_limit = None
+        self.daily_remaining = None
+        self.minute_limit = None
+        self.minute_remaining = None
+        self._sent = deque()
+        self.calls = 0
+
+    @property
+    def api_key(self):
+        if self._api_key is None:
+            self._api_key = load_api()
+        return self._api_key
+
+    def _cache_path(self, endpoint, params):
+        key = json.dumps(sorted((k, str(v)) for k, v in (params or {}).items()))
+        return self.cache_dir / endpoint.strip("/") / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _is_past_season(params):
+        """a season that ended before this year can't change anymore"""
+        season = str((params or {}).get("season", ""))
+        return season.isdigit() and int(season) < time.localtime().tm_year - 1
+
+    def _read_cache(self, path, params):
+        if not path.exists():
+            return None
+        expired = self.cache_ttl is not None and time.time() - path.stat().st_mtime > self.cache_ttl
+        if expired and not self._is_past_season(params):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    @staticmethod
+    def _header_int(headers, name):
+        value = headers.get(name)
+        return int(value) if value is not None and value.isdigit() else None
+
+    def _update_quota(self, headers):
+        """read the remaining budget (requests headers are case insensitive)"""
+        daily_limit = self._header_int(headers, "x-ratelimit-requests-limit")
+        daily_remaining = self._header_int(headers, "x-ratelimit-requests-remaining")
+        minute_limit = self._header_int(headers, "X-RateLimit-Limit")
+        minute_remaining = self._header_int(headers, "X-RateLimit-Remaining")
+        if daily_limit is not None:
+            self.daily_limit = daily_limit
+        if daily_remaining is not None:
+            self.daily_remaining = daily_remaining
+        if minute_limit is not None:
+            self.minute_limit = minute_limit
+        if minute_remaining is not None:
+            self.minute_remaining = minute_remaining
+
+    def _wait_for_minute_budget(self):
+        """when the minute budget is spent, wait until the oldest request of the last minute leaves the window"""
+        now = time.monotonic()
+        while self._sent and now - self._sent[0] > 60:
+            self._sent.popleft()
+        spent = self.minute_remaining == 0 or (self.minute_limit and len(self._sent) >= self.minute_limit)
+        if spent and self._sent:
+            wait = 60 - (now - self._sent[0])
+            if wait > 0:
+                print(f"Minute quota spent, waiting {wait:.0f} s")
+                time.sleep(wait)
+            self.minute_remaining = None
+
+    def _request(self, endpoint, params):
+        if self.daily_remaining is not None and self.daily_remaining <= self.reserve:
+            raise QuotaExceeded(self.daily_remaining)
+
+        for attempt in range(2):
+            self._wait_for_minute_budget()
+            self._sent.append(time.monotonic())
+            self.calls += 1
+            response = self.session.get(f"{BASE_URL}/{endpoint.strip('/')}", params=params,
+                                        headers={"x-apisports-key": self.api_key}, timeout=self.timeout)
+            self._update_quota(response.headers)
+            if response.status_code != 200:
+                if response.status_code == 429 and attempt == 0:
+                    self.minute_remaining = 0
+                    continue
+                raise APIFootballError(response.status_code, response.text)
+
+            payload = response.json()
+            # the API answers 200 with an "errors" block for bad params and exhausted quotas
+            errors = payload.get("errors")
+            if errors:
+                if isinstance(errors, dict) and "rateLimit" in errors and attempt == 0:
+                    self.minute_remaining = 0
+                    continue
+                if isinstance(errors, dict) and "requests" in errors:
+                    self.daily_remaining = 0
+                    raise QuotaExceeded(0)
+                raise APIFootballError(response.status_code, errors)
+            return payload
+        raise APIFootballError(429, "rate limited")
+
+    def get_page(self, endpoint, params=None, use_cache=True):
+        """one page of an endpoint, from the cache when it was already downloaded"""
+        path = self._cache_path(endpoint, params) if self.cache_dir is not None else None
+        if use_cache and path is not None:
+            payload = self._read_cache(path, params)
+            if payload is not None:
+                return payload
+
+        payload = self._request(endpoint, params)
+        if path is not None:
+            write_json(path, payload)
+        return payload
+
+    def get(self, endpoint, params=None, use_cache=True, all_pages=True):
+        """
+        request an endpoint, following the pagination
+
+        Args:
+            endpoint (str): e.g. "fixtures", "players".
+            params (dict): query params.
+            use_cache (bool): False to always hit the API (and refresh the cache).
+            all_pages (bool): download every page and join their "response" lists.
+
+        Returns:
+            dict: the API payload, with the responses of all the pages.
+        """
+        params = dict(params or {})
+        payload = self.get_page(endpoint, params, use_cache)
+        paging = payload.get("paging") or {}
+        total = paging.get("total") or 1
+        if not all_pages or total <= 1:
+            return payload
+
+        responses = list(payload.get("response") or [])
+        for page in range(2, total + 1):
+            responses.extend(self.get_page(endpoint, {**params, "page": page}, use_cache).get("response") or [])
+        return {**payload, "results": len(responses), "paging": {"current": total, "total": total},
+                "response": responses}
+
+    def quota(self):
+        return {"daily_limit": self.daily_limit, "daily_remaining": self.daily_remaining,
+                "minute_limit": self.minute_limit, "minute_remaining": self.minute_remaining,
+                "calls": self.calls}
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_client = None
+
+
+def client():
+    """shared client of the module functions, created on first use"""
+    global _client
+    if _client is None:
+        _client = APIFootball()
+    return _client
+
 
 def get(endpoint, params=None):
-    url = f"{BASE_URL}/{endpoint}"
-    response = requests.get(url, headers=HEADERS, params=params)
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"Error {response.status_code}: {response.text}")
+    try:
+        return client().get(endpoint, params)
+    except APIFootballError as e:
+        print(e)
         return None
 
+
 def get_leagues():
     return get("leagues")
 
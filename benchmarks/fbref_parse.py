@@ -0,0 +1,62 @@
+"""Parse throughput of recorded fbref match-report pages.
+
+Compares the old BeautifulSoup (html.parser) lookup of #team_stats and the
+commented #team_stats_extra with footyIG.fbref_html, on saved pages.
+
+    python benchmarks/fbref_parse.py data/pages/*.html --min-speedup 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from bs4 import BeautifulSoup, Comment
+
+from footyIG.fbref_html import FbrefPage, parse_team_stats, parse_team_stats_extra
+
+
+def parse_bs4(html):
+    soup = BeautifulSoup(html, "html.parser")
+    team_stats = soup.find(id="team_stats")
+    extra = soup.find(id="team_stats_extra")
+    if extra is None:
+        comment = soup.find(string=lambda text: isinstance(text, Comment) and 'id="team_stats_extra"' in text)
+        extra = BeautifulSoup(comment, "html.parser").find(id="team_stats_extra") if comment else None
+    return team_stats, extra
+
+
+def parse_lxml(html):
+    page = FbrefPage(html)
+    rows, home, away = parse_team_stats(page.get("team_stats"))
+    return rows, parse_team_stats_extra(page.get("team_stats_extra"), home, away)
+
+
+def pages_per_second(func, pages, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            func(html)
+    return repeat * len(pages) / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('pages', nargs='+', type=Path)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-speedup', type=float, default=5)
+    args = parser.parse_args()
+
+    pages = [path.read_bytes() for path in args.pages]
+    old = pages_per_second(parse_bs4, pages, args.repeat)
+    new = pages_per_second(parse_lxml, pages, args.repeat)
+    print(f"bs4 html.parser: {old:.1f} pages/s")
+    print(f"fbref_html:      {new:.1f} pages/s ({new / old:.1f}x)")
+    if new / old < args.min_speedup:
+        print("Below the expected speedup")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
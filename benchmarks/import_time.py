@@ -0,0 +1,54 @@
+"""Cold `import footyIG` time.
+
+Runs the import in fresh interpreters and fails (exit code 1) if the best time
+goes over the budget, so a heavy dependency added at import time is noticed.
+
+    python benchmarks/import_time.py --budget-ms 50
+"""
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def import_time_us(module):
+    """Cumulative import time of ``module`` in microseconds, from ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [f.strip() for f in line.split('|')]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1])
+    raise RuntimeError(f"No import time found for {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--module', default='footyIG')
+    parser.add_argument('--budget-ms', type=float, default=50)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    times = [import_time_us(args.module) / 1000 for _ in range(args.runs)]
+    best = min(times)
+    print(f"import {args.module}: best {best:.1f} ms of {args.runs} runs (budget {args.budget_ms:.0f} ms)")
+
+    heavy = subprocess.run(
+        [sys.executable, '-c', f'import sys, {args.module}; '
+         'print(",".join(m for m in ("pandas", "numpy", "selenium", "requests", "bs4") if m in sys.modules))'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    if heavy:
+        print(f"Heavy modules loaded at import time: {heavy}")
+
+    if best > args.budget_ms:
+        print("Over budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
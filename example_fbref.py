@@ -2,7 +2,7 @@ import footyIG as fty
 import pandas as pd
 from pathlib import Path
 
-fbref = fty.Fbref()
+fbref = fty.Fbref(workers=4)
 
 #Step 1
 season = "2023-2024"
@@ -12,18 +12,12 @@ print(fixtures_df)
 fixtures_df.to_csv(fixtures_out_path, index=False)
 print(f"Fixtures saved to {fixtures_out_path}")
 
-#Step 2
-for idx, url in enumerate(fixtures_df["Match URL"]):
-    if idx == 10 : break
-
-    print(f"Scraping match {idx + 1}/{len(fixtures_df)}: {url}")
-    try:
-        fbref.scrape_and_save_match_stats(url)
-    except Exception as e:
-        print(f"Failed to scrape match: {url}")
-        print(f"Error: {e}")
+#Step 2: only the matches not saved yet are scraped, so it can be run again after an interruption
+summary = fbref.crawl_season(season_slug = season, league_name = "Premier-League", fixtures_df = fixtures_df)
+print(summary)
 
 #Step 3
 combined_df = fbref.combine_all_stats(season=season)
 print("Combined DataFrame:")
-print(combined_df.head(10))
\ No newline at end of file
+print(combined_df.head(10))
+fbref.close()
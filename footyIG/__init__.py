@@ -1,4 +1,27 @@
-from .fbref import Fbref
-from .scores365 import Scores365
+import importlib
+
 from .config import *
-from .exceptions import *
\ No newline at end of file
+from .exceptions import *
+
+# Heavy submodules (pandas, requests, bs4...) are only imported when one of their
+# names is used, so `import footyIG` stays cheap for jobs that need a single client.
+_lazy = {
+    'Fbref': '.fbref',
+    'Scores365': '.scores365',
+    'MatchBundle': '.scores365',
+    'Scores365Async': '.scores365_async',
+    'LiveMatchWatcher': '.live',
+    'read_ndjson': '.ndjson',
+}
+
+
+def __getattr__(name):
+    if name in _lazy:
+        value = getattr(importlib.import_module(_lazy[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy))
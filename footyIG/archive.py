@@ -0,0 +1,92 @@
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+
+from .cache import cache_key
+from .files import write_atomic
+
+
+class RawArchive:
+    """Compressed, content-addressed archive of every raw payload fetched.
+
+    Payloads are stored once per distinct content under ``objects/`` (named by
+    their SHA-256, zlib compressed), so fetching the same page again only adds an
+    index row. ``index.sqlite`` records every fetch with its source, request key
+    (URL plus params, see ``cache_key``) and fetch time, which lets the scrapers
+    replay a whole season from disk after a parser fix.
+
+    Args:
+        archive_dir (str | Path): Folder of the archive.
+        level (int): zlib compression level.
+    """
+
+    def __init__(self, archive_dir, level=6):
+        self.path = Path(archive_dir)
+        self.objects = self.path / 'objects'
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.level = level
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path / 'index.sqlite', check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS fetches ('
+            'source TEXT, key TEXT, url TEXT, fetched_at REAL, status INTEGER, digest TEXT, size INTEGER)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS fetches_key ON fetches (source, key, fetched_at)')
+        self._db.commit()
+
+    def _object_path(self, digest):
+        return self.objects / digest[:2] / digest[2:]
+
+    def put(self, source, url, body, params=None, status=200):
+        """Archive a raw payload (bytes or str) fetched from ``url``.
+
+        Returns:
+            str: SHA-256 of the payload.
+        """
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            write_atomic(path, zlib.compress(body, self.level))
+
+        key, _ = cache_key(url, params)
+        with self._lock:
+            self._db.execute('INSERT INTO fetches VALUES (?, ?, ?, ?, ?, ?, ?)',
+                             (source, key, url, time.time(), status, digest, len(body)))
+            self._db.commit()
+        return digest
+
+    def read(self, digest):
+        with open(self._object_path(digest), 'rb') as f:
+            return zlib.decompress(f.read())
+
+    def latest(self, source, url, params=None, before=None):
+        """Most recent payload archived for a request, fetched before ``before`` (epoch seconds)
+        if given. None if it was never archived."""
+        key, _ = cache_key(url, params)
+        with self._lock:
+            row = self._db.execute(
+                'SELECT digest FROM fetches WHERE source = ? AND key = ? AND fetched_at <= ? '
+                'ORDER BY fetched_at DESC LIMIT 1',
+                (source, key, float('inf') if before is None else before),
+            ).fetchone()
+        return None if row is None else self.read(row[0])
+
+    def entries(self, source=None, since=None):
+        """Index rows as ``(source, url, fetched_at, status, digest, size)`` tuples, oldest first."""
+        query = 'SELECT source, url, fetched_at, status, digest, size FROM fetches WHERE fetched_at >= ?'
+        args = [since or 0]
+        if source is not None:
+            query += ' AND source = ?'
+            args.append(source)
+        with self._lock:
+            return self._db.execute(query + ' ORDER BY fetched_at', args).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
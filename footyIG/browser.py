@@ -0,0 +1,148 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from .exceptions import RateLimited
+from .scheduler import is_rate_limited_page
+
+# Requests that are never needed to read the stats tables
+BLOCKED_URLS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*', '*google-analytics.com*',
+    '*adservice.google.*', '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.*', '*taboola.com*',
+]
+
+
+class BrowserPool:
+    """Pool of long-lived headless Chrome drivers.
+
+    Drivers are started on demand, up to ``workers``, and reused for every page
+    instead of launching a browser per match. Pages load with the ``eager``
+    strategy, images, fonts and ads are blocked, and ``fetch`` waits for the
+    wanted elements explicitly instead of sleeping.
+
+    Args:
+        workers (int): Max drivers alive at the same time.
+        headless (bool): Run Chrome without a window.
+        wait_timeout (float): Max seconds to wait for the elements of a page.
+        page_load_timeout (float): Max seconds for a page load.
+        block_resources (bool): Block images, fonts and ads.
+    """
+
+    def __init__(self, workers=2, headless=True, wait_timeout=20, page_load_timeout=30, block_resources=True):
+        self.workers = workers
+        self.headless = headless
+        self.wait_timeout = wait_timeout
+        self.page_load_timeout = page_load_timeout
+        self.block_resources = block_resources
+        self._idle = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(workers)
+
+    def _new_driver(self):
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--disable-extensions")
+        options.page_load_strategy = 'eager'
+        if self.block_resources:
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.managed_default_content_settings.fonts": 2,
+            })
+
+        driver = webdriver.Chrome(options=options)
+        driver.set_page_load_timeout(self.page_load_timeout)
+        if self.block_resources:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
+        with self._lock:
+            self._drivers.append(driver)
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @contextmanager
+    def driver(self):
+        """Borrow a driver. A driver that fails is replaced by a new one on the next borrow."""
+        self._slots.acquire()
+        try:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                driver = self._new_driver()
+            try:
+                yield driver
+            except TimeoutException:
+                # A slow page doesn't mean the browser is broken
+                self._idle.put(driver)
+                raise
+            except WebDriverException:
+                self._discard(driver)
+                raise
+            except Exception:
+                # Rate limit pages and other errors of the caller leave the browser usable
+                self._idle.put(driver)
+                raise
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def fetch(self, url, element_ids):
+        """Load ``url`` and return ``{id: outerHTML}`` for the given element ids.
+
+        Args:
+            url (str): Page to load.
+            element_ids (list): Ids that must be in the page before reading it.
+
+        Returns:
+            dict: ``{id: outerHTML}``.
+        """
+        with self.driver() as driver:
+            driver.get(url)
+            try:
+                WebDriverWait(driver, self.wait_timeout).until(EC.all_of(
+                    *(EC.presence_of_element_located((By.ID, element_id)) for element_id in element_ids)
+                ))
+            except TimeoutException as e:
+                if is_rate_limited_page(200, driver.page_source):
+                    raise RateLimited(url) from e
+                raise
+            return {
+                element_id: driver.find_element(By.ID, element_id).get_attribute("outerHTML")
+                for element_id in element_ids
+            }
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+        self._idle = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,152 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+STATUS_SCHEDULED = 2
+STATUS_LIVE = 3
+STATUS_FINISHED = 4
+
+# Params that change between calls without changing the answer for a finished game.
+VOLATILE_PARAMS = ('lastUpdateId',)
+
+
+def cache_key(url, params=None):
+    """Endpoint plus sorted query params, so the same request always maps to the same key."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    query += [(k, str(v)) for k, v in (params or {}).items()]
+    query = [(k, v) for k, v in query if k not in VOLATILE_PARAMS]
+    endpoint = f"{parts.scheme}://{parts.netloc}{parts.path}"
+    return f"{endpoint}?{urlencode(sorted(query))}", endpoint
+
+
+class ResponseCache:
+    """On-disk cache of JSON responses with LRU eviction and status-aware TTLs.
+
+    Payloads are stored compressed in a SQLite file under ``cache_dir``. When
+    the total size goes over ``max_bytes`` the least recently read entries are
+    evicted. The TTL of each entry follows the ``statusGroup`` of the games in
+    it: finished games never change so they are kept forever, scheduled games
+    get ``ttl_scheduled`` and live games only ``ttl_live`` seconds.
+
+    Args:
+        cache_dir (str | Path): Folder for the cache database.
+        max_bytes (int): Max size of the stored (compressed) payloads.
+        ttl_scheduled (float): Seconds to keep payloads of scheduled games.
+        ttl_live (float): Seconds to keep payloads of live games.
+        ttl_default (float): Seconds to keep payloads without games (leaderboards...).
+    """
+
+    def __init__(self, cache_dir, max_bytes=512 * 1024 ** 2, ttl_scheduled=6 * 3600, ttl_live=15, ttl_default=3600):
+        self.path = Path(cache_dir)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_scheduled = ttl_scheduled
+        self.ttl_live = ttl_live
+        self.ttl_default = ttl_default
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path / 'responses.sqlite', check_same_thread=False)
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, endpoint TEXT, body BLOB, size INTEGER, '
+            'expires_at REAL, accessed_at REAL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+        self._db.commit()
+
+    def _until_kickoff(self, start_times):
+        """Seconds until the earliest kick-off still to come (0 if one is overdue), None if unknown."""
+        now = time.time()
+        starts = []
+        for start_time in start_times:
+            try:
+                starts.append(datetime.fromisoformat(start_time).timestamp() - now)
+            except (TypeError, ValueError):
+                continue
+        return max(0, min(starts)) if starts else None
+
+    def ttl_for_status(self, status_group, start_time=None):
+        if status_group == STATUS_FINISHED:
+            return None
+        if status_group == STATUS_LIVE:
+            return self.ttl_live
+        return self._scheduled_ttl([start_time])
+
+    def _scheduled_ttl(self, start_times):
+        # A scheduled game turns live at kick-off, so its copy can't outlive it
+        until_kickoff = self._until_kickoff(start_times)
+        if until_kickoff is None:
+            return self.ttl_scheduled
+        return min(self.ttl_scheduled, max(self.ttl_live, until_kickoff))
+
+    def ttl_for(self, payload):
+        """TTL in seconds for a payload (None means it never expires)."""
+        if isinstance(payload.get('game'), dict):
+            games = [payload['game']]
+        else:
+            games = payload.get('games') or []
+        if not games:
+            return self.ttl_default
+        statuses = [g.get('statusGroup') for g in games]
+        if STATUS_LIVE in statuses:
+            return self.ttl_live
+        if all(s == STATUS_FINISHED for s in statuses):
+            return None
+        return self._scheduled_ttl([g.get('startTime') for g in games if g.get('statusGroup') != STATUS_FINISHED])
+
+    def get(self, url, params=None):
+        key, _ = cache_key(url, params)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute('SELECT body, expires_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            body, expires_at = row
+            if expires_at is not None and expires_at < now:
+                self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._db.commit()
+                return None
+            self._db.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self._db.commit()
+        return json.loads(zlib.decompress(body))
+
+    def set(self, url, params, payload, ttl=None):
+        """Store ``payload``. ``ttl`` None keeps it until it is evicted."""
+        key, endpoint = cache_key(url, params)
+        body = zlib.compress(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._db.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)',
+                (key, endpoint, body, len(body), expires_at, now),
+            )
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        self._db.execute('DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at < ?', (time.time(),))
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+        rows = self._db.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._db.execute('DELETE FROM responses WHERE key = ?', (key,))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM responses')
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
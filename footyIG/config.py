@@ -1,66 +1,167 @@
-import pandas as pd
-import numpy as np
-
-from selenium.webdriver.chrome.options import Options
-import undetected_chromedriver as uc
-from IPython.display import clear_output
-from selenium.webdriver.common.by import By
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from .exceptions import *
 
+@dataclass(frozen=True)
+class League:
+    """A competition available in a page."""
+    name: str
+    id: int
+    url_name: str
+    page: str = '365Scores'
+    seasons: tuple = None
+    aliases: tuple = field(default=())
+
+    def as_dict(self):
+        return {'id': self.id, 'URLname': self.url_name, 'seasons': None if self.seasons is None else list(self.seasons)}
+
+
+_DEFAULT_LEAGUES = (
+    League('Bundesliga', 25, 'bundesliga', aliases=('German Bundesliga',)),
+    League('DFB-Pokal', 28, 'dfb-pokal', aliases=('DFB Pokal',)),
+    League('Premier League', 7, 'premier-league', aliases=('EPL', 'English Premier League')),
+    League('FA Cup', 8, 'fa-cup'),
+    League('LaLiga', 11, 'laliga', aliases=('La Liga',)),
+    League('Copa del Rey', 13, 'copa-del-rey'),
+    League('Betplay Dimayor', 620, 'liga-betplay', aliases=('Liga BetPlay', 'Liga Betplay Dimayor')),
+    League('Libertadores', 102, 'libertadores', aliases=('Copa Libertadores', 'CONMEBOL Libertadores')),
+    League('Sudamericana', 389, 'conmebol-sudamericana', aliases=('Copa Sudamericana', 'CONMEBOL Sudamericana')),
+    League('Europa League', 573, 'uefa-europa-league', aliases=('UEFA Europa League', 'UEL')),
+    League('Conference League', 7685, 'uefa-conference-league', aliases=('UEFA Conference League', 'UECL')),
+    League('Champions League', 572, 'uefa-champions-league', aliases=('UEFA Champions League', 'UCL')),
+    League('Copa America', 595, 'copa-america', aliases=('Copa América',)),
+    League('Eurocopa', 6316, 'euro', aliases=('Euro', 'UEFA Euro')),
+)
+
+
+def _norm(key):
+    return str(key).strip().casefold()
+
+
+class _Indexes:
+    """Read-only indexes of one version of the registry, swapped in as a whole."""
+
+    def __init__(self, leagues):
+        by_name, by_key, legacy = {}, {}, {}
+        for (page, name), league in leagues.items():
+            by_name.setdefault(page, {})[name] = league
+            legacy.setdefault(page, {})[name] = MappingProxyType(league.as_dict())
+            for key in (league.name, league.id, league.url_name, *league.aliases):
+                by_key[(page, _norm(key))] = league
+
+        self.leagues = MappingProxyType(dict(leagues))
+        self.by_name = MappingProxyType({page: MappingProxyType(d) for page, d in by_name.items()})
+        self.by_key = MappingProxyType(by_key)
+        self.legacy = MappingProxyType({page: MappingProxyType(d) for page, d in legacy.items()})
+
+
+class LeagueRegistry:
+    """Immutable index of the leagues of every page.
+
+    Lookups by name, numeric id, URL name or alias are single dict hits. Adding
+    leagues builds a new set of read-only indexes and swaps it in with a single
+    assignment, so readers never see a half updated one.
+    """
+
+    def __init__(self, leagues=()):
+        self._indexes = _Indexes({})
+        self._lock = threading.Lock()
+        self.register(*leagues)
+
+    def register(self, *leagues):
+        """Add or replace leagues (a league with the same page and name is replaced)."""
+        with self._lock:
+            merged = dict(self._indexes.leagues)
+            for league in leagues:
+                merged[(league.page, league.name)] = league
+            self._indexes = _Indexes(merged)
+
+    def load_file(self, path):
+        """Register the leagues of a JSON file: a list of
+        ``{"name", "id", "URLname", "page"?, "seasons"?, "aliases"?}`` objects."""
+        with open(path, encoding='utf-8') as f:
+            entries = json.load(f)
+        self.register(*(
+            League(name=e['name'], id=int(e['id']), url_name=e['URLname'], page=e.get('page', '365Scores'),
+                   seasons=None if e.get('seasons') is None else tuple(e['seasons']),
+                   aliases=tuple(e.get('aliases', ())))
+            for e in entries
+        ))
+
+    def pages(self):
+        return list(self._indexes.by_name.keys())
+
+    def leagues(self, page='365Scores'):
+        """Leagues of a page as ``{name: League}``."""
+        by_name = self._indexes.by_name
+        if page not in by_name:
+            raise ValueError(f"Page '{page}' not available. Available pages: {self.pages()}")
+        return by_name[page]
+
+    def as_dicts(self, page='365Scores'):
+        """Leagues of a page as ``{name: {'id', 'URLname', 'seasons'}}`` (read-only)."""
+        indexes = self._indexes
+        if page not in indexes.legacy:
+            raise ValueError(f"Page '{page}' not available. Available pages: {self.pages()}")
+        return indexes.legacy[page]
+
+    def get(self, key, page='365Scores'):
+        """League by name, id, URL name or alias. None if it doesn't exist."""
+        return self._indexes.by_key.get((page, _norm(key)))
+
+    def find(self, key, page='365Scores'):
+        """Like ``get`` but raises InvalidLeagueException if the league doesn't exist."""
+        league = self.get(key, page)
+        if league is None:
+            raise InvalidLeagueException(key, list(self.leagues(page)))
+        return league
+
+
+registry = LeagueRegistry(_DEFAULT_LEAGUES)
+
+# Extra competitions can be added without editing code, from a JSON file.
+if os.environ.get('FOOTYIG_LEAGUES_FILE'):
+    registry.load_file(os.environ['FOOTYIG_LEAGUES_FILE'])
+
+
+def load_leagues_file(path):
+    """Add the leagues of a JSON file to the registry (see LeagueRegistry.load_file)."""
+    registry.load_file(path)
+
+
 def get_possible_leagues(league, season, page):
     """Dictionary with all the possible pages, leagues and season for the scraper."""
 
-    possible_leagues = {
-        '365Scores': {
-            'Bundesliga': {'id': 25, 'URLname': 'bundesliga' ,'seasons': None},
-            'DFB-Pokal': {'id': 28, 'URLname': 'dfb-pokal' ,'seasons': None},
-            'Premier League': {'id': 7, 'URLname': 'premier-league', 'seasons': None},
-            'FA Cup': {'id': 8, 'URLname': 'fa-cup' ,'seasons': None},
-            'LaLiga': {'id': 11, 'URLname': 'laliga', 'seasons': None},
-            'Copa del Rey': {'id': 13, 'URLname': 'copa-del-rey' ,'seasons': None},
-            'Betplay Dimayor': {'id': 620, 'URLname': 'liga-betplay', 'seasons': None},
-            'Libertadores': {'id': 102, 'URLname': 'libertadores', 'season': None},
-            'Sudamericana': {'id': 389, 'URLname': 'conmebol-sudamericana', 'season': None},
-            'Europa League': {'id': 573, 'URLname': 'uefa-europa-league', 'seasons': None},
-            'Conference League': {'id': 7685, 'URLname': 'uefa-conference-league', season: None},
-            'Champions League': {'id': 572, 'URLname': 'uefa-champions-league', 'seasons': None},
-            'Copa America': {'id': 595, 'URLname': 'copa-america', 'seasons': None},
-            'Eurocopa': {'id': 6316, 'URLname': 'euro', 'seasons': None},
-        },
-    }
-
     if not isinstance(page, str):
         raise InvalidStrType(page)
-    
-    if page not in possible_leagues:
-        raise ValueError(f"Page '{page}' not available. Available pages: {list(possible_leagues.keys())}")
+
+    if page not in registry.pages():
+        raise ValueError(f"Page '{page}' not available. Available pages: {registry.pages()}")
 
     if not isinstance(league, str):
         raise InvalidStrType(league)
-    
+
     if season is not None and not isinstance(season, str):
         raise InvalidStrType(season)
-    
-    possible_leagues_list = list(possible_leagues[page].keys())
-    if league not in possible_leagues_list:
-        raise InvalidLeagueException(league, possible_leagues_list)
-    
-    if possible_leagues[page][league]['seasons'] is not None:
-        possible_seasons_list = list(possible_leagues[page][league]['seasons'])
-        if season not in possible_seasons_list:
-            raise InvalidSeasonException(season, possible_seasons_list)
-
-    return possible_leagues
+
+    league_config = registry.find(league, page)
+
+    if league_config.seasons is not None and season not in league_config.seasons:
+        raise InvalidSeasonException(season, list(league_config.seasons))
+
+    return {page: registry.as_dicts(page)}
 
 def get_all_leagues(page = '365Scores'):
-    return list(get_possible_leagues_for_page(page).keys())
+    return list(registry.leagues(page).keys())
 
 def get_possible_leagues_for_page(page):
     """Get possible leagues for a particular page."""
-    leagues = get_possible_leagues('Bundesliga', '2023', page)[page] #bundes is just arbitrary value
-    return leagues
+    return registry.as_dicts(page)
 
 def get_available_pages():
     """Get available scraping pages."""
-    return ['365Scores']
+    return registry.pages()
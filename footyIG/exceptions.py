@@ -25,4 +25,14 @@ class MatchDoesntHaveInfo(Exception):
 class InvalidStrType(Exception):
     def __init__(self, param):
         self.message = f"{param} must be a string.\n{param} debe ser un string"
-        super().__init__(self.message)
\ No newline at end of file
+        super().__init__(self.message)
+
+class RateLimited(Exception):
+    def __init__(self, url):
+        self.message = f"Rate limited while requesting {url}.\nLímite de peticiones alcanzado al pedir {url}."
+        super().__init__(self.message)
+
+class NotArchived(Exception):
+    def __init__(self, source, url):
+        self.message = f"{url} is not in the {source} archive, it can't be replayed offline.\n{url} no está en el archivo de {source}, no se puede reproducir sin conexión."
+        super().__init__(self.message)
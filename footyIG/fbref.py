@@ -1,118 +1,453 @@
 import requests
-from bs4 import BeautifulSoup, Comment
 from urllib.parse import urlparse
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from io import StringIO
 import pandas as pd
+import json
+import threading
 import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from .archive import RawArchive
+from .exceptions import NotArchived, RateLimited
+from .files import write_json
+from .fbref_html import (MATCH_REPORT_PATH, FbrefPage, parse_fixtures_table, parse_stats_table, parse_team_stats,
+                         parse_team_stats_extra, scorebox_team_ids, text)
+from .scheduler import (PRIORITY_BACKFILL, PRIORITY_FIXTURES, PRIORITY_MATCH_REPORT,
+                        PoliteScheduler, is_rate_limited_page)
+
+# Table families of a match report: id template ({team} is the fbref team id) for the per-team ones
+PLAYER_TABLES = {
+    "summary": "stats_{team}_summary",
+    "passing": "stats_{team}_passing",
+    "passing_types": "stats_{team}_passing_types",
+    "defense": "stats_{team}_defense",
+    "possession": "stats_{team}_possession",
+    "misc": "stats_{team}_misc",
+    "keeper": "keeper_stats_{team}",
+}
+MATCH_REPORT_TABLES = ("team_stats", "team_stats_extra", *PLAYER_TABLES, "shots")
+
+
 class Fbref:
     BASE_URL = "https://fbref.com"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
+    }
 
-    def __init__(self, data_dir="data/raw/fbref"):
+    def __init__(self, data_dir="data/raw/fbref", workers=1, headless=True, requests_per_minute=10, scheduler=None,
+                 archive_dir=None, replay=False):
+        """
+        Args:
+            data_dir (str | Path): Folder for the scraped data.
+            workers (int): Browsers kept open to scrape match pages in parallel.
+            headless (bool): Run the browsers without a window.
+            requests_per_minute (float): Budget for all the fbref traffic (HTTP and browser).
+            scheduler (PoliteScheduler): Scheduler to share with other clients, ignores
+                                         ``requests_per_minute`` if given.
+            archive_dir (str | Path): Folder of the raw archive, every page (and browser
+                                      fragment) downloaded is kept there. No archive if None.
+            replay (bool): Read every page from the archive instead of the network, to
+                           re-parse past seasons offline.
+        """
+        if replay and not archive_dir:
+            raise ValueError("replay needs an archive_dir to read from.")
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.workers = workers
+        self.headless = headless
+        self._browser_pool = None
+        self._pool_lock = threading.Lock()
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.scheduler = scheduler or PoliteScheduler(requests_per_minute=requests_per_minute)
+        self.archive = RawArchive(archive_dir) if archive_dir else None
+        self.replay = replay
+
+    def browser_pool(self):
+        """Pool of long-lived browsers, started the first time a match page is scraped."""
+        with self._pool_lock:
+            if self._browser_pool is None:
+                # Selenium is only needed here, import it lazily so the rest of the package doesn't pay for it
+                from .browser import BrowserPool
+                self._browser_pool = BrowserPool(workers=self.workers, headless=self.headless)
+            return self._browser_pool
+
+    def close(self):
+        """Quit the browsers of the pool."""
+        if self._browser_pool is not None:
+            self._browser_pool.close()
+            self._browser_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
 
     def build_fixture_url(self, competition_id, season_slug, league_name):
         return f"{self.BASE_URL}/en/comps/{competition_id}/{season_slug}/schedule/{season_slug}-{league_name}-Scores-and-Fixtures"
 
-    def extract_commented_table(self, soup):
-        comments = soup.find_all(string=lambda text: isinstance(text, Comment))
-        for comment in comments:
-            if "table" in comment and "Scores and Fixtures" in comment:
-                return BeautifulSoup(comment, "html.parser").find("table")
-        return None
+    def get_html(self, url, priority=PRIORITY_MATCH_REPORT):
+        """Download a fbref page (raw bytes) when the scheduler allows it.
+
+        Raises:
+            RateLimited: fbref kept answering with a rate limit page.
+            NotArchived: In replay mode, the page was never archived.
+        """
+        if self.replay:
+            body = self.archive.latest("fbref", url)
+            if body is None:
+                raise NotArchived("fbref", url)
+            return body
+
+        response = self.scheduler.get(self.session, url, priority=priority, timeout=30)
+        if is_rate_limited_page(response.status_code, response.content):
+            raise RateLimited(url)
+        response.raise_for_status()
+        if self.archive is not None:
+            self.archive.put("fbref", url, response.content, status=response.status_code)
+        return response.content
+
+    def browser_fetch(self, url, element_ids, priority=PRIORITY_MATCH_REPORT):
+        """``{id: outerHTML}`` of a page rendered by the browser pool, archived (or replayed) as JSON."""
+        if self.replay:
+            body = self.archive.latest("fbref-browser", url)
+            if body is None:
+                raise NotArchived("fbref-browser", url)
+            return json.loads(body)
+
+        self.scheduler.acquire(priority)
+        try:
+            html = self.browser_pool().fetch(url, element_ids)
+        except RateLimited:
+            self.scheduler.throttled()
+            raise
+        if self.archive is not None:
+            self.archive.put("fbref-browser", url, json.dumps(html, ensure_ascii=False))
+        return html
+
+    def extract_static_elements(self, html, element_ids):
+        """Find elements by id in the static HTML, also inside HTML comments.
+
+        fbref ships many blocks commented out and uncomments them with JavaScript,
+        so an id missing from the markup is looked up in the comment that contains it.
+
+        Returns:
+            dict: ``{id: element}`` for the ids found.
+        """
+        page = html if isinstance(html, FbrefPage) else FbrefPage(html)
+        found = {element_id: page.get(element_id) for element_id in element_ids}
+        return {element_id: element for element_id, element in found.items() if element is not None}
 
-    def scrape_fixtures(self, competition_id=9, season_slug="2023-2024", league_name="Premier-League"):
+    def extract_commented_table(self, page):
+        return page.find_table("Scores and Fixtures")
+
+    def scrape_fixtures(self, competition_id=9, season_slug="2023-2024", league_name="Premier-League", backfill=False):
         url = self.build_fixture_url(competition_id, season_slug, league_name)
-        response = requests.get(url)
-        soup = BeautifulSoup(response.content, "html.parser")
-        table = soup.find("table") or self.extract_commented_table(soup)
-        if not table:
+        priority = PRIORITY_FIXTURES + (PRIORITY_BACKFILL if backfill else 0)
+        page = FbrefPage(self.get_html(url, priority))
+        table = page.find_table("Scores and Fixtures")
+        if table is None:
             return None
-        df = pd.read_html(StringIO(str(table)))[0].dropna(subset=["Date"]).reset_index(drop=True)
-
-        urls = [
-            self.BASE_URL + cell.find("a")["href"]
-            for row in table.find_all("tr")
-            if (cell := row.find("td", {"data-stat": "match_report"})) and cell.find("a")
-        ]
-        if len(df) != len(urls):
-            df = df.iloc[:len(urls)]
-        df["Match URL"] = urls
-        return df
+        return parse_fixtures_table(table, self.BASE_URL)
 
     def extract_match_id(self, url):
         return urlparse(url).path.split('/')[3]
 
-    def scrape_team_stats(self, url, headless=True):
-        options = Options()
-        if headless:
-            options.add_argument("--headless")
-        driver = webdriver.Chrome(options=options)
-        driver.get(url)
-        time.sleep(5)
+    def scrape_team_stats(self, url, headless=None, browser_fallback=True, priority=PRIORITY_MATCH_REPORT):
+        """Team stats of a match report.
 
-        team_html = driver.find_element(By.ID, "team_stats").get_attribute("outerHTML")
-        extra_html = driver.find_element(By.ID, "team_stats_extra").get_attribute("outerHTML")
-        driver.quit()
+        The tables are read from the static HTML over plain HTTP. The browser is only
+        used if extracting them fails (and ``browser_fallback`` is True); network
+        errors and rate limits are raised as they are.
 
-        main_rows, home, away = self.parse_team_stats_html(team_html)
-        extra_rows = self.parse_team_stats_extra_html(extra_html, home, away)
+        Returns:
+            tuple: (df_main, df_extra, home, away)
+        """
+        element_ids = ["team_stats", "team_stats_extra"]
+        page = self.get_html(url, priority)
+        try:
+            html = self.extract_static_elements(page, element_ids)
+            main_rows, home, away = self.parse_team_stats_html(html["team_stats"])
+            extra_rows = self.parse_team_stats_extra_html(html["team_stats_extra"], home, away)
+        except Exception as e:
+            if not browser_fallback:
+                raise
+            print(f"[INFO] Static extraction failed for {url} ({e!r}), using the browser.")
+            if headless is not None:
+                self.headless = headless
+            html = self.browser_fetch(url, element_ids, priority)
+            main_rows, home, away = self.parse_team_stats_html(html["team_stats"])
+            extra_rows = self.parse_team_stats_extra_html(html["team_stats_extra"], home, away)
 
         df_main = pd.DataFrame(main_rows, columns=["Stat", home, away])
         df_extra = pd.DataFrame(extra_rows, columns=["Stat", home, away])
         return df_main, df_extra, home, away
 
+    def scrape_match_report(self, url, tables=MATCH_REPORT_TABLES, priority=PRIORITY_MATCH_REPORT):
+        """Every requested table of a match report from a single page load.
+
+        Args:
+            url (str): Match report URL.
+            tables (list): Names from ``MATCH_REPORT_TABLES``: ``team_stats``, ``team_stats_extra``
+                           (long format, like the saved CSVs), the player tables ``summary``,
+                           ``passing``, ``passing_types``, ``defense``, ``possession``, ``misc``,
+                           ``keeper`` and ``shots``.
+            priority (int): Scheduler priority of the request.
+
+        Returns:
+            dict: ``{table: DataFrame}``. Every frame has a ``match_id`` column, the player
+            tables also ``team_id``, ``team`` and ``home``. Tables missing from the page are empty.
+        """
+        unknown = [table for table in tables if table not in MATCH_REPORT_TABLES]
+        if unknown:
+            raise ValueError(f"Unknown tables {unknown}. Available tables: {list(MATCH_REPORT_TABLES)}")
+
+        match_id = self.extract_match_id(url)
+        page = FbrefPage(self.get_html(url, priority))
+        # The scorebox gives the home team id. The ids of the player tables can't tell home
+        # from away: tables shipped commented out are indexed after the visible ones.
+        home_id = next(iter(scorebox_team_ids(page)), None)
+        team_ids = [element_id.split("_")[1] for element_id in page.ids("stats_") if element_id.endswith("_summary")]
+        main, extra = page.get("team_stats"), page.get("team_stats_extra")
+        home = away = None
+        if main is not None:
+            main_rows, home, away = parse_team_stats(main)
+
+        result = {}
+        if "team_stats" in tables or "team_stats_extra" in tables:
+            empty = pd.DataFrame(columns=["Stat", "Team", "Value", "Table"])
+            if main is not None:
+                extra_rows = parse_team_stats_extra(extra, home, away) if extra is not None else []
+                df_main = self.melt_team_stats(pd.DataFrame(main_rows, columns=["Stat", home, away]), "Main")
+                df_extra = self.melt_team_stats(pd.DataFrame(extra_rows, columns=["Stat", home, away]), "Extra")
+            else:
+                df_main, df_extra = empty, empty.copy()
+            if "team_stats" in tables:
+                result["team_stats"] = df_main
+            if "team_stats_extra" in tables:
+                result["team_stats_extra"] = df_extra
+
+        for name, template in PLAYER_TABLES.items():
+            if name not in tables:
+                continue
+            frames = []
+            for team_id in team_ids:
+                table = page.get(template.format(team=team_id))
+                if table is None:
+                    continue
+                df = parse_stats_table(table)
+                caption = table.find("caption")
+                team = text(caption).replace("Goalkeeper Stats Table", "").replace("Player Stats Table", "").strip() \
+                    if caption is not None else None
+                # Without scorebox, match the caption's team with the team_stats header
+                is_home = team_id == home_id if home_id else (team == home if home and team else None)
+                frames.append(df.assign(team_id=team_id, team=team, home=is_home))
+            result[name] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+        if "shots" in tables:
+            table = page.get("shots_all")
+            result["shots"] = parse_stats_table(table) if table is not None else pd.DataFrame()
+
+        for name, df in result.items():
+            df.insert(0, "match_id", match_id)
+        return result
+
     def parse_team_stats_html(self, html):
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table")
-        rows = table.find_all("tr")
-        home = rows[0].find("th", style="text-align: right;").get_text(strip=True)
-        away = rows[0].find("th", style="text-align: left;").get_text(strip=True)
-        data = []
-        for i in range(1, len(rows), 2):
-            th = rows[i].find("th")
-            if not th: continue
-            stat = th.get_text(strip=True)
-            tds = rows[i+1].find_all("td")
-            data.append([stat, tds[0].get_text(" ", strip=True), tds[1].get_text(" ", strip=True)])
-        return data, home, away
+        """Parse ``#team_stats`` (HTML string or lxml element)."""
+        if isinstance(html, (str, bytes)):
+            page = FbrefPage(html)
+            html = page.get("team_stats")
+            if html is None:
+                html = page.root
+        return parse_team_stats(html)
 
     def parse_team_stats_extra_html(self, html, home, away):
-        soup = BeautifulSoup(html, "html.parser")
-        container = soup.find(id="team_stats_extra")
-        data = []
-        if container:
-            for block in container.find_all("div", recursive=False):
-                values = [d.get_text(strip=True) for d in block.find_all("div", recursive=False) if "th" not in (d.get("class") or [])]
-                for i in range(0, len(values), 3):
-                    if i + 2 < len(values):
-                        data.append({"Stat": values[i+1], home: values[i], away: values[i+2]})
-        return data
+        """Parse ``#team_stats_extra`` (HTML string or lxml element)."""
+        element = html if not isinstance(html, (str, bytes)) else FbrefPage(html).get("team_stats_extra")
+        if element is None:
+            return []
+        return parse_team_stats_extra(element, home, away)
 
     def melt_team_stats(self, df, tag):
         return df.melt(id_vars=["Stat"], var_name="Team", value_name="Value").assign(Table=tag)
 
-    def scrape_and_save_match_stats(self, url, headless=True):
+    def match_stats_dir(self, season=None):
+        """Folder of the per-match long CSVs, one subfolder per season."""
+        out_path = self.data_dir / "team_stats" / "long"
+        return out_path / season if season else out_path
+
+    def scrape_and_save_match_stats(self, url, headless=None, season=None, priority=PRIORITY_MATCH_REPORT):
         match_id = self.extract_match_id(url)
-        df_main, df_extra, home, away = self.scrape_team_stats(url, headless)
+        df_main, df_extra, home, away = self.scrape_team_stats(url, headless, priority=priority)
         df_main_long = self.melt_team_stats(df_main, "Main")
         df_extra_long = self.melt_team_stats(df_extra, "Extra")
         df_combined = pd.concat([df_main_long, df_extra_long], ignore_index=True)
         df_combined["MatchID"] = match_id
 
-        out_path = self.data_dir / "team_stats" / "long"
+        out_path = self.match_stats_dir(season)
         out_path.mkdir(parents=True, exist_ok=True)
         df_combined.to_csv(out_path / f"{match_id}.csv", index=False)
         return df_combined
     
-    def combine_all_stats(self, season="2023-2024"):
-        stats_path = self.data_dir / "team_stats" / "long" / season
-        all_files = list(stats_path.glob("*.csv"))
-        all_dfs = [pd.read_csv(f) for f in all_files]
-        df_combined = pd.concat(all_dfs, ignore_index=True)
-        df_combined.to_csv(self.data_dir / f"team_stats_long_{season}.csv", index=False)
+    def scrape_and_save_many(self, urls, headless=None, season=None):
+        """Scrape and save several matches, one per browser of the pool at a time.
+
+        Returns:
+            dict: ``{url: DataFrame}`` for the scraped matches and ``{url: exception}`` for the failed ones.
+        """
+        def scrape(url):
+            try:
+                return self.scrape_and_save_match_stats(url, headless, season)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return dict(zip(urls, executor.map(scrape, urls)))
+
+    @staticmethod
+    def _is_transient(error):
+        """Network errors, timeouts, 429 and 5xx are worth retrying; parse errors and 404 are not."""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout, RateLimited)):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return type(error).__name__ == "TimeoutException"
+
+    def _scrape_with_retries(self, url, season, retries, backoff, priority):
+        for attempt in range(retries + 1):
+            try:
+                self.scrape_and_save_match_stats(url, season=season, priority=priority)
+                return attempt + 1
+            except Exception as e:
+                if attempt == retries or not self._is_transient(e):
+                    e.attempts = attempt + 1
+                    raise
+                time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+    def crawl_season(self, competition_id=9, season_slug="2023-2024", league_name="Premier-League",
+                     fixtures_df=None, workers=None, retries=3, backoff=2.0, retry_failed=False, backfill=False):
+        """
+        Scrape and save the team stats of every match of a season that isn't saved yet.
+
+        Matches whose ``{match_id}.csv`` already exists are skipped, the rest run on
+        ``workers`` threads. Transient errors (network, timeouts, 429/5xx) are retried
+        with exponential backoff; matches that still fail are written to
+        ``_crawl_manifest.json`` in the season folder and skipped by later runs.
+
+        Args:
+            competition_id, season_slug, league_name: Season to crawl (see scrape_fixtures).
+            fixtures_df (pd.DataFrame): Fixtures with a "Match URL" column, scraped if None.
+            workers (int): Matches scraped in parallel. Defaults to the browser workers.
+            retries (int): Retries of a match after a transient error.
+            backoff (float): Seconds of the first retry wait, doubled on every retry.
+            retry_failed (bool): Try again the matches that failed permanently before.
+            backfill (bool): Past season: its requests wait behind the ones of current seasons.
+
+        Returns:
+            dict: Number of matches ``scraped``, ``skipped`` and ``failed``.
+        """
+        if fixtures_df is None:
+            fixtures_df = self.scrape_fixtures(competition_id, season_slug, league_name, backfill)
+        if fixtures_df is None or "Match URL" not in fixtures_df:
+            print(f"[ERROR] No fixtures found for {league_name} {season_slug}.")
+            return {"scraped": 0, "skipped": 0, "failed": 0}
+        out_path = self.match_stats_dir(season_slug)
+        out_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = out_path / "_crawl_manifest.json"
+        manifest = {"failed": {}}
+        if manifest_path.exists():
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+
+        # Only played matches have a report; fixtures_df may come from elsewhere, so check the path too
+        urls = [url for url in fixtures_df["Match URL"]
+                if isinstance(url, str) and urlparse(url).path.startswith(MATCH_REPORT_PATH)]
+        done = {p.stem for p in out_path.glob("*.csv")}
+        skip = done if retry_failed else done | set(manifest["failed"])
+        pending = [url for url in urls if self.extract_match_id(url) not in skip]
+        print(f"[INFO] {len(pending)} of {len(urls)} matches pending for {season_slug}.")
+
+        priority = PRIORITY_MATCH_REPORT + (PRIORITY_BACKFILL if backfill else 0)
+        scraped = failed = 0
+        with ThreadPoolExecutor(max_workers=workers or self.workers) as executor:
+            futures = {executor.submit(self._scrape_with_retries, url, season_slug, retries, backoff, priority): url
+                       for url in pending}
+            for future in as_completed(futures):
+                url = futures[future]
+                match_id = self.extract_match_id(url)
+                try:
+                    future.result()
+                    manifest["failed"].pop(match_id, None)
+                    scraped += 1
+                except Exception as e:
+                    print(f"[ERROR] Failed to scrape match {url}: {e}")
+                    manifest["failed"][match_id] = {"url": url, "error": repr(e), "attempts": getattr(e, "attempts", 1)}
+                    failed += 1
+                write_json(manifest_path, manifest)
+
+        return {"scraped": scraped, "skipped": len(urls) - len(pending), "failed": failed}
+
+    def _read_match_stats(self, path):
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, na_values=[""])
+        df["MatchID"] = df["MatchID"].fillna(path.stem)
+        # Numeric part of values like "55%" or "4 of 10 — 40%"
+        df["ValueNum"] = pd.to_numeric(df["Value"].str.extract(r"(-?\d+(?:\.\d+)?)", expand=False), errors="coerce")
+        return df
+
+    def compact_stats(self, season="2023-2024", workers=4):
+        """Append the per-match CSVs of a season not compacted yet to a Parquet dataset.
+
+        The dataset lives in ``team_stats/parquet/season={season}/``; every run adds one
+        part file with the new matches only, and ``_manifest.json`` keeps the match ids
+        already compacted.
+
+        Args:
+            season (str): Season folder of the per-match CSVs.
+            workers (int): Files read in parallel.
+
+        Returns:
+            Path: Folder of the season dataset.
+        """
+        dataset_path = self.data_dir / "team_stats" / "parquet" / f"season={season}"
+        dataset_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = dataset_path / "_manifest.json"
+        compacted = set()
+        if manifest_path.exists():
+            with open(manifest_path, encoding="utf-8") as f:
+                compacted = set(json.load(f)["compacted"])
+
+        new_files = sorted(p for p in self.match_stats_dir(season).glob("*.csv") if p.stem not in compacted)
+        if not new_files:
+            return dataset_path
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            frames = list(executor.map(self._read_match_stats, new_files))
+        df = pd.concat(frames, ignore_index=True)
+        df = df.astype({"Stat": "category", "Team": "category", "Table": "category",
+                        "Value": "string", "MatchID": "string", "ValueNum": "float64"})
+        df.to_parquet(dataset_path / f"part-{time.strftime('%Y%m%d%H%M%S')}-{len(compacted)}.parquet", index=False)
+
+        compacted.update(p.stem for p in new_files)
+        write_json(manifest_path, {"compacted": sorted(compacted)})
+        return dataset_path
+
+    def combine_all_stats(self, season="2023-2024", workers=4, save_csv=False):
+        """Compact the new per-match files of a season and return all its team stats.
+
+        Args:
+            season (str): Season folder of the per-match CSVs.
+            workers (int): Files read in parallel.
+            save_csv (bool): Also write the whole season to ``team_stats_long_{season}.csv``.
+
+        Returns:
+            pd.DataFrame: Team stats of every compacted match of the season.
+        """
+        dataset_path = self.compact_stats(season, workers)
+        if not any(dataset_path.glob("*.parquet")):
+            return pd.DataFrame()
+        df_combined = pd.read_parquet(dataset_path)
+        if save_csv:
+            df_combined.to_csv(self.data_dir / f"team_stats_long_{season}.csv", index=False)
+        return df_combined
@@ -0,0 +1,232 @@
+import lxml.html
+import pandas as pd
+from lxml import etree
+
+# fbref pages are always UTF-8, don't let lxml guess from the bytes
+_UTF8_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+# Match reports live under this path; upcoming fixtures link to a head-to-head page instead
+MATCH_REPORT_PATH = "/en/matches/"
+
+
+def text(element, sep=""):
+    """Stripped text of an element, like BeautifulSoup's ``get_text(sep, strip=True)``."""
+    return sep.join(s.strip() for s in element.itertext() if s.strip())
+
+
+class FbrefPage:
+    """A fbref page parsed once with lxml.
+
+    The first lookup walks the tree a single time to index every element id and
+    keep the comment nodes. Elements that fbref ships commented out are found by
+    parsing only the comment that contains the wanted id; its ids are then added
+    to the index so the next lookups are dict hits too.
+
+    Args:
+        html (str | bytes): Page, or fragment, to parse.
+    """
+
+    def __init__(self, html):
+        if isinstance(html, bytes):
+            html = lxml.html.fromstring(html, parser=_UTF8_PARSER)
+        elif isinstance(html, str):
+            html = lxml.html.fromstring(html)
+        self.root = html
+        self._ids = None
+        self._comments = None
+
+    def _index(self):
+        self._ids, self._comments = {}, []
+        for element in self.root.iter():
+            if element.tag is etree.Comment:
+                self._comments.append(element)
+            else:
+                element_id = element.get("id")
+                if element_id is not None:
+                    self._ids.setdefault(element_id, element)
+
+    def _uncomment(self, marker):
+        """Parse the first comment containing ``marker`` and index its ids."""
+        for i, comment in enumerate(self._comments):
+            if comment.text and marker in comment.text:
+                del self._comments[i]
+                fragment = lxml.html.fragment_fromstring(comment.text, create_parent="div")
+                for element in fragment.iter():
+                    if element.tag is not etree.Comment and element.get("id") is not None:
+                        self._ids.setdefault(element.get("id"), element)
+                return fragment
+        return None
+
+    def get(self, element_id):
+        """Element with this id, also if it is inside an HTML comment. None if missing."""
+        if self._ids is None:
+            self._index()
+        element = self._ids.get(element_id)
+        if element is None and self._uncomment(f'id="{element_id}"') is not None:
+            element = self._ids.get(element_id)
+        return element
+
+    def ids(self, prefix=""):
+        """Ids of the page starting with ``prefix``, including the ones in comments."""
+        if self._ids is None:
+            self._index()
+        while self._uncomment(f'id="{prefix}') is not None:
+            pass
+        return [element_id for element_id in self._ids if element_id.startswith(prefix)]
+
+    def find_table(self, marker=None):
+        """First table of the page, or the first commented table containing ``marker``."""
+        table = self.root.find(".//table")
+        if table is None and marker is not None:
+            if self._ids is None:
+                self._index()
+            fragment = self._uncomment(marker)
+            if fragment is not None:
+                table = fragment.find(".//table")
+        return table
+
+
+def scorebox_team_ids(page):
+    """fbref team ids of a match report from its scorebox, home team first (empty if there is none)."""
+    scorebox = page.root.find(".//div[@class='scorebox']")
+    if scorebox is None:
+        return []
+    team_ids = []
+    for link in scorebox.iterfind(".//strong/a"):
+        parts = (link.get("href") or "").split("/")
+        # /en/squads/{team_id}/{name}-Stats
+        if len(parts) > 3 and parts[2] == "squads" and parts[3] not in team_ids:
+            team_ids.append(parts[3])
+    return team_ids
+
+
+def parse_team_stats(element):
+    """Rows of ``#team_stats`` as ([stat, home value, away value], home, away)."""
+    table = element if element.tag == "table" else element.find(".//table")
+    rows = table.findall(".//tr")
+    header = rows[0].findall("th")
+    home = next(text(th) for th in header if "right" in (th.get("style") or ""))
+    away = next(text(th) for th in header if "left" in (th.get("style") or ""))
+    data = []
+    for i in range(1, len(rows) - 1, 2):
+        th = rows[i].find("th")
+        if th is None:
+            continue
+        tds = rows[i + 1].findall("td")
+        data.append([text(th), text(tds[0], " "), text(tds[1], " ")])
+    return data, home, away
+
+
+def parse_team_stats_extra(element, home, away):
+    """Rows of ``#team_stats_extra`` as ``{"Stat", home, away}`` dicts."""
+    data = []
+    for block in element.iterchildren("div"):
+        values = [text(d) for d in block.iterchildren("div") if "th" not in (d.get("class") or "").split()]
+        for i in range(0, len(values) - 2, 3):
+            data.append({"Stat": values[i + 1], home: values[i], away: values[i + 2]})
+    return data
+
+
+def _header_names(table):
+    """``{data-stat: header text}`` from the last header row, with repeated names numbered like pandas (xG, xG.1)."""
+    header_rows = table.findall("thead/tr")
+    if not header_rows:
+        return {}
+    names, seen = {}, {}
+    for th in header_rows[-1].iterchildren("th", "td"):
+        stat = th.get("data-stat")
+        name = text(th) or stat
+        if stat is None:
+            continue
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names[stat] = name if count == 0 else f"{name}.{count}"
+    return names
+
+
+def parse_fixtures_table(table, base_url):
+    """Read a fixtures table row by row, each row's cells together with its match report link.
+
+    Returns:
+        pd.DataFrame: One row per fixture with a ``Date``, ``Match URL`` (None when there
+        is no report yet) and ``match_id``, plus typed ``Kickoff``, ``HomeGoals``
+        and ``AwayGoals`` columns.
+    """
+    names = _header_names(table)
+    rows = []
+    for tr in table.iterfind(".//tbody/tr"):
+        classes = (tr.get("class") or "").split()
+        if "spacer" in classes or "thead" in classes:
+            continue
+        row = {}
+        url = None
+        for cell in tr.iterchildren("th", "td"):
+            stat = cell.get("data-stat")
+            if stat is None:
+                continue
+            row[names.get(stat, stat)] = text(cell, " ") or None
+            if stat == "match_report":
+                link = cell.find(".//a")
+                if link is not None and (link.get("href") or "").startswith(MATCH_REPORT_PATH):
+                    url = base_url + link.get("href")
+        row["Match URL"] = url
+        rows.append(row)
+
+    df = pd.DataFrame(rows, columns=list(names.values()) + ["Match URL"] if names else None)
+    date_col = names.get("date", "Date")
+    if date_col not in df:
+        return df
+    df = df.dropna(subset=[date_col]).reset_index(drop=True)
+
+    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+    time_col = names.get("start_time")
+    if time_col in df:
+        start = df[time_col].str.extract(r"(\d{1,2}:\d{2})", expand=False)
+        df["Kickoff"] = pd.to_datetime(df[date_col].dt.strftime("%Y-%m-%d") + " " + start, errors="coerce")
+    score_col = names.get("score")
+    if score_col in df:
+        goals = df[score_col].str.extract(r"(\d+)\s*[–-]\s*(\d+)")
+        df["HomeGoals"] = pd.to_numeric(goals[0]).astype("Int64")
+        df["AwayGoals"] = pd.to_numeric(goals[1]).astype("Int64")
+    for stat in ("gameweek", "attendance", "home_xg", "away_xg"):
+        column = names.get(stat)
+        if column in df:
+            df[column] = pd.to_numeric(df[column].str.replace(",", "", regex=False), errors="coerce")
+    df["match_id"] = df["Match URL"].str.split("/").str[5]
+    return df
+
+
+def _numeric(column):
+    """The column as numbers if every non-empty value is one (commas removed), else unchanged."""
+    values = pd.to_numeric(column.str.replace(",", "", regex=False), errors="coerce")
+    if values.isna().sum() > column.isna().sum():
+        return column
+    if (values.dropna() % 1 == 0).all():
+        return values.astype("Int64")
+    return values
+
+
+def parse_stats_table(table):
+    """Read a player/keeper/shots table of a match report into a typed frame.
+
+    Columns are the cells' ``data-stat`` names, which are unique and stable across
+    pages unlike the grouped headers. Header and spacer rows inside the body are
+    skipped, numeric columns are converted and the rest stay strings.
+    """
+    rows = []
+    for tr in table.iterfind(".//tbody/tr"):
+        classes = (tr.get("class") or "").split()
+        if "spacer" in classes or "thead" in classes or "over_header" in classes:
+            continue
+        row = {}
+        for cell in tr.iterchildren("th", "td"):
+            stat = cell.get("data-stat")
+            if stat is not None:
+                row[stat] = text(cell, " ") or None
+        if row:
+            rows.append(row)
+
+    df = pd.DataFrame(rows)
+    for column in df.columns:
+        df[column] = _numeric(df[column].astype("string"))
+    return df
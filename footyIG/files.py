@@ -0,0 +1,26 @@
+import json
+import os
+import threading
+from pathlib import Path
+
+
+def write_atomic(path, data):
+    """Write ``data`` (bytes or str) to a temporary file and rename it over ``path``.
+
+    Readers, and a run interrupted halfway, only ever see the old or the new
+    file, never a half written one.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f'{path.name}.{os.getpid()}-{threading.get_ident()}.tmp')
+    if isinstance(data, str):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+    else:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_json(path, obj, indent=4):
+    """Write ``obj`` as JSON with ``write_atomic``."""
+    write_atomic(path, json.dumps(obj, indent=indent, ensure_ascii=False))
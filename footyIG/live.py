@@ -0,0 +1,143 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from footyIG.cache import STATUS_FINISHED, STATUS_LIVE
+from footyIG.scores365 import Scores365
+
+
+def _event_key(event):
+    event_type = event.get('eventType') or {}
+    return (event.get('competitorId'), event_type.get('id'), event_type.get('subTypeId'),
+            event.get('gameTime'), event.get('addedTime'), event.get('playerId'))
+
+
+def _snapshot(game, stats):
+    """Fields of a match that are tracked between polls."""
+    return {
+        'score': (game['homeCompetitor'].get('score'), game['awayCompetitor'].get('score')),
+        'status': {k: game.get(k) for k in ('statusGroup', 'statusText', 'gameTime', 'gameTimeDisplay')},
+        'events': {_event_key(e): e for e in game.get('events', [])},
+        'stats': {(s.get('competitorId'), s.get('name')): s.get('value') for s in (stats or {}).get('statistics', [])},
+    }
+
+
+def _diff(old, new):
+    """Changes from snapshot ``old`` (None for a new match) to ``new`` as (kind, data) pairs."""
+    old = old or {'score': None, 'status': {}, 'events': {}, 'stats': {}}
+    changes = []
+    if new['score'] != old['score']:
+        changes.append(('score', {'old': old['score'], 'new': new['score']}))
+
+    status = {k: v for k, v in new['status'].items() if old['status'].get(k) != v}
+    if status:
+        changes.append(('status', status))
+
+    for key, event in new['events'].items():
+        if key not in old['events']:
+            changes.append(('event', event))
+    for key, event in old['events'].items():
+        if key not in new['events']:
+            changes.append(('event_removed', event))
+
+    deltas = [
+        {'competitorId': team_id, 'name': name, 'old': old['stats'].get((team_id, name)), 'new': value}
+        for (team_id, name), value in new['stats'].items()
+        if old['stats'].get((team_id, name)) != value
+    ]
+    if deltas:
+        changes.append(('stats', deltas))
+    return changes
+
+
+class LiveMatchWatcher:
+    """Poll the live games of some leagues and emit only what changed.
+
+    Every ``interval`` seconds the today games of the leagues are requested.
+    When their ``lastUpdateId`` did not move nothing else is fetched; otherwise
+    the live games are fetched concurrently and compared with the previous poll.
+    Each change is a dict with ``match_id``, ``home_team``, ``away_team``, ``kind``
+    (``score``, ``status``, ``event``, ``event_removed`` or ``stats``) and ``data``.
+
+    Args:
+        leagues (str | list): Leagues to watch (names from get_all_leagues()).
+        client (Scores365): Client to use. A new one is created if None.
+        interval (float): Seconds between polls.
+        with_stats (bool): Also track the team statistics of the live games.
+
+    Example:
+        watcher = LiveMatchWatcher(['Premier League', 'LaLiga'])
+        watcher.run(print)
+
+        async for change in LiveMatchWatcher('LaLiga'):
+            ...
+    """
+
+    def __init__(self, leagues, client=None, interval=15, with_stats=True):
+        self.leagues = [leagues] if isinstance(leagues, str) else list(leagues)
+        self.client = client or Scores365()
+        self.interval = interval
+        self.with_stats = with_stats
+        self._snapshots = {}
+        self._last_update = None
+
+    def _games_to_poll(self):
+        """Live games, plus the tracked ones that just finished, if anything changed."""
+        # Polling is about noticing changes, a cached list would hide kick-offs
+        games = self.client.get_today_games(leagues=self.leagues, use_cache=False)
+        last_update = games.attrs.get('lastUpdateId')
+        unchanged = last_update is not None and last_update == self._last_update
+        self._last_update = last_update
+        if unchanged or games.empty:
+            return []
+        polled = (games['status_group'] == STATUS_LIVE) | games['match_id'].isin(self._snapshots)
+        return list(games[polled].itertuples())
+
+    def _fetch(self, row):
+        # A cached copy could be the one from before the change that made this game due
+        game = self.client.get_match_data(row.match_url, use_cache=False)
+        stats = None
+        if self.with_stats and game.get('statusGroup') in (STATUS_LIVE, STATUS_FINISHED):
+            stats = self.client.get_match_stats(row.match_id, status_group=game.get('statusGroup'), use_cache=False)
+        return row, game, stats
+
+    def poll(self):
+        """Poll once and return the list of changes since the previous poll."""
+        rows = self._games_to_poll()
+        if not rows:
+            return []
+
+        changes = []
+        with ThreadPoolExecutor(max_workers=self.client.transport.max_per_host) as executor:
+            for row, game, stats in executor.map(self._fetch, rows):
+                snapshot = _snapshot(game, stats)
+                for kind, data in _diff(self._snapshots.get(row.match_id), snapshot):
+                    changes.append({'match_id': row.match_id, 'home_team': row.home_team,
+                                    'away_team': row.away_team, 'kind': kind, 'data': data})
+                if game.get('statusGroup') == STATUS_FINISHED:
+                    self._snapshots.pop(row.match_id, None)
+                else:
+                    self._snapshots[row.match_id] = snapshot
+        return changes
+
+    def run(self, callback, max_polls=None):
+        """Poll forever (or ``max_polls`` times) calling ``callback(change)`` for every change."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            for change in self.poll():
+                callback(change)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def stream(self):
+        """Async iterator over the changes, polling every ``interval`` seconds."""
+        while True:
+            started = time.monotonic()
+            for change in await asyncio.to_thread(self.poll):
+                yield change
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def __aiter__(self):
+        return self.stream()
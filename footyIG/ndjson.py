@@ -0,0 +1,54 @@
+import gzip
+import json
+import threading
+from pathlib import Path
+
+
+def _open(path, mode):
+    path = Path(path)
+    if path.suffix == '.gz':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class NDJSONWriter:
+    """Append-only newline-delimited JSON sink, one object per line.
+
+    Files ending in ``.gz`` are gzip compressed. Writing a batch only appends
+    its lines, so dumping a season round by round stays linear in time.
+
+    Args:
+        path (str | Path): Output file.
+        append (bool): Keep the current content of the file instead of truncating it.
+    """
+
+    def __init__(self, path, append=False):
+        self.path = Path(path)
+        self._file = _open(self.path, 'a' if append else 'w')
+        self._lock = threading.Lock()
+
+    def write_many(self, objs):
+        lines = ''.join(json.dumps(obj, ensure_ascii=False) + '\n' for obj in objs)
+        with self._lock:
+            self._file.write(lines)
+            self._file.flush()
+
+    def write(self, obj):
+        self.write_many([obj])
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def read_ndjson(path):
+    """Yield the objects of an NDJSON file (gzip aware) one by one, without loading the whole file."""
+    with _open(path, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
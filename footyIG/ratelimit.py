@@ -0,0 +1,97 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+THROTTLE_STATUS = (429, 503)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Bucket:
+    def __init__(self, rate, burst, min_rate, max_rate):
+        self.rate = rate
+        self.capacity = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.step = rate * 0.1
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+
+
+class RateLimiter:
+    """Adaptive token-bucket limiter, one bucket per host.
+
+    Every request takes a token; tokens refill at ``rate`` per second up to
+    ``burst``. The rate is halved when the server answers 429/503 (honouring
+    ``Retry-After``) and grows back step by step while responses are healthy,
+    so throughput follows the real server limit. A single instance can be
+    shared by threads.
+
+    Args:
+        rate (float): Initial requests per second for each host.
+        burst (int): Max requests that can go out back to back.
+        min_rate (float): Lower bound for the rate after backing off.
+        max_rate (float): Upper bound for the rate while speeding up.
+        per_host (dict): ``{host: {'rate': .., 'burst': .., 'min_rate': .., 'max_rate': ..}}``
+            to override the defaults for certain hosts.
+    """
+
+    def __init__(self, rate=2.0, burst=4, min_rate=0.2, max_rate=8.0, per_host=None):
+        self.defaults = {'rate': rate, 'burst': burst, 'min_rate': min_rate, 'max_rate': max_rate}
+        self.per_host = per_host or {}
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = _Bucket(**{**self.defaults, **self.per_host.get(host, {})})
+            self._buckets[host] = bucket
+        return bucket
+
+    def _reserve(self, host):
+        """Take a token for ``host`` and return how long the caller must wait for it."""
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            bucket.tokens = min(bucket.capacity, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            # Tokens may go negative: each caller reserves its own slot in the future.
+            bucket.tokens -= 1
+            wait = -bucket.tokens / bucket.rate if bucket.tokens < 0 else 0.0
+            return max(wait, bucket.blocked_until - now)
+
+    def acquire(self, host):
+        wait = self._reserve(host)
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(self, host, status_code, retry_after=None):
+        """Feed a response back so the bucket of ``host`` can adapt its rate."""
+        with self._lock:
+            bucket = self._bucket(host)
+            now = time.monotonic()
+            if status_code in THROTTLE_STATUS:
+                bucket.rate = max(bucket.min_rate, bucket.rate / 2)
+                bucket.tokens = min(bucket.tokens, 0.0)
+                pause = retry_after if retry_after is not None else 1.0 / bucket.rate
+                bucket.blocked_until = max(bucket.blocked_until, now + pause)
+            elif status_code < 400:
+                bucket.rate = min(bucket.max_rate, bucket.rate + bucket.step)
+
+    def rate(self, host):
+        with self._lock:
+            return self._bucket(host).rate
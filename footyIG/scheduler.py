@@ -0,0 +1,97 @@
+import heapq
+import itertools
+import random
+import re
+import threading
+import time
+
+from .ratelimit import parse_retry_after
+
+PRIORITY_FIXTURES = 0
+PRIORITY_MATCH_REPORT = 10
+# Added to the priority of requests for past seasons so the current one goes first
+PRIORITY_BACKFILL = 100
+
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_RATE_LIMITED = re.compile(r"rate.?limit|too many requests|\b429\b", re.IGNORECASE)
+
+
+def is_rate_limited_page(status_code, html):
+    """True for a 429 or a page whose title says the client was rate limited."""
+    if status_code == 429:
+        return True
+    title = _TITLE.search(html[:5000] if isinstance(html, str) else html[:5000].decode("utf-8", "ignore"))
+    return bool(title and _RATE_LIMITED.search(title.group(1)))
+
+
+class PoliteScheduler:
+    """Per-host request scheduler with priorities, a requests-per-minute budget and jitter.
+
+    Callers wait in a priority queue (lower number first, FIFO within a priority)
+    and are released one at a time, spaced ``60 / requests_per_minute`` seconds
+    apart with random jitter. When the host answers with a rate limit page the
+    scheduler pauses everyone for ``Retry-After`` (or ``pause`` seconds, doubled on
+    every consecutive rate limit up to ``max_pause``).
+
+    Args:
+        requests_per_minute (float): Budget of requests for the host.
+        jitter (float): Spacing varies randomly by +/- this fraction.
+        pause (float): Seconds to stop after a rate limit without Retry-After.
+        max_pause (float): Longest pause after consecutive rate limits.
+    """
+
+    def __init__(self, requests_per_minute=10, jitter=0.2, pause=60, max_pause=900):
+        self.requests_per_minute = requests_per_minute
+        self.jitter = jitter
+        self.pause = pause
+        self.max_pause = max_pause
+        self._queue = []
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._next_slot = 0.0
+        self._strikes = 0
+
+    @property
+    def spacing(self):
+        return 60.0 / self.requests_per_minute
+
+    def acquire(self, priority=PRIORITY_MATCH_REPORT):
+        """Block until it's this caller's turn to send a request."""
+        ticket = (priority, next(self._counter))
+        with self._cond:
+            heapq.heappush(self._queue, ticket)
+            while True:
+                now = time.monotonic()
+                if self._queue[0] == ticket and now >= self._next_slot:
+                    heapq.heappop(self._queue)
+                    spacing = self.spacing * random.uniform(1 - self.jitter, 1 + self.jitter)
+                    self._next_slot = now + spacing
+                    self._cond.notify_all()
+                    return
+                timeout = self._next_slot - now if self._queue[0] == ticket else None
+                self._cond.wait(timeout)
+
+    def throttled(self, retry_after=None):
+        """The host rate limited us: pause every caller."""
+        with self._cond:
+            self._strikes += 1
+            if retry_after is None:
+                retry_after = min(self.max_pause, self.pause * 2 ** (self._strikes - 1))
+            self._next_slot = max(self._next_slot, time.monotonic() + retry_after)
+            print(f"[INFO] Rate limited, pausing {retry_after:.0f} s.")
+            self._cond.notify_all()
+
+    def healthy(self):
+        with self._cond:
+            self._strikes = 0
+
+    def get(self, session, url, priority=PRIORITY_MATCH_REPORT, retries=3, **kwargs):
+        """GET ``url`` with ``session`` when the scheduler allows it, pausing and retrying on rate limits."""
+        for attempt in range(retries + 1):
+            self.acquire(priority)
+            response = session.get(url, **kwargs)
+            if not is_rate_limited_page(response.status_code, response.content):
+                self.healthy()
+                return response
+            self.throttled(parse_retry_after(response.headers.get("Retry-After")))
+        return response
@@ -1,38 +1,275 @@
 import pandas as pd
-import time
+import numpy as np
 import json
-import requests
+import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from dateutil import parser as date_parser
 from footyIG.config import *
+from footyIG.transport import Transport
+from footyIG.cache import STATUS_FINISHED, STATUS_LIVE, ResponseCache
+from footyIG.archive import RawArchive
+from footyIG.ndjson import NDJSONWriter
+from footyIG.files import write_json
+
+# Partition of the games without a round in the player stats dataset
+NO_ROUND = '__none__'
+# Every file of the player stats dataset is written with these types, so the whole
+# folder reads back as one table even when a match has no ids or positions
+PLAYER_STATS_SCHEMA = {'match_id': 'string', 'team': 'string', 'player_id': 'Int64', 'player_name': 'string',
+                       'position': 'string', 'stat_name': 'string', 'value': 'string'}
+
+
+class MatchBundle:
+    """Payloads of one match, fetched at most once and shared by every helper.
+
+    ``Scores365.get_players``, ``get_players_stats``, ``extract_statistics`` and
+    ``get_match_events`` accept a bundle in place of the match URL, so a
+    pipeline that needs several of them downloads the ``/web/game/`` payload a
+    single time.
+    """
+
+    def __init__(self, client, match_url):
+        self.client = client
+        self.match_url = match_url
+        self.matchup_id, self.game_id = client._get_ids(match_url)
+        self._data = None
+        self._stats = None
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self.client.get_match_data(self.match_url)
+        return self._data
+
+    @property
+    def stats(self):
+        if self._stats is None:
+            status_group = self._data.get('statusGroup') if self._data else None
+            start_time = self._data.get('startTime') if self._data else None
+            self._stats = self.client.get_match_stats(self.game_id, status_group=status_group, start_time=start_time)
+        return self._stats
+
+    @property
+    def status_group(self):
+        return self.data.get('statusGroup')
+
+    def players(self):
+        return pd.DataFrame(self.data.get('members', []))
+
+    def events(self):
+        return self.data.get('events', [])
+
 
 class Scores365:
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36'
     }
 
+    def __init__(self, pool_size=10, max_per_host=10, timeout=(5, 30), limiter=None,
+                 cache_dir=None, cache_size=512 * 1024 ** 2, archive_dir=None, replay=False):
+        """
+        Args:
+            pool_size (int): Number of hosts kept in the connection pool.
+            max_per_host (int): Max open connections per host.
+            timeout (float | tuple): (connect, read) timeout in seconds for every request.
+            limiter (RateLimiter): Rate limiter to share with other clients. A default
+                                   adaptive one is created if None.
+            cache_dir (str | Path): Folder for the on-disk response cache. No cache if None.
+            cache_size (int): Max bytes kept in the cache before evicting old entries.
+            archive_dir (str | Path): Folder of the raw archive, every payload downloaded is
+                                      kept there. No archive if None.
+            replay (bool): Read every payload from the archive instead of the network.
+        """
+        if replay and not archive_dir:
+            raise ValueError("replay needs an archive_dir to read from.")
+        self.transport = Transport(headers=self.headers, pool_size=pool_size,
+                                   max_per_host=max_per_host, timeout=timeout, limiter=limiter)
+        self.limiter = self.transport.limiter
+        self.cache = ResponseCache(cache_dir, max_bytes=cache_size) if cache_dir else None
+        self.archive = RawArchive(archive_dir) if archive_dir else None
+        self.replay = replay
+        self._season_state = {}
+
+    def _get(self, url, params=None):
+        """All the 365Scores endpoints go through the shared pooled transport."""
+        return self.transport.get(url, params=params)
+
+    def _get_json(self, url, params=None, error='request', use_cache=True, status_group=None, start_time=None):
+        """GET a JSON endpoint, served from the cache when there is a fresh copy.
+
+        Args:
+            use_cache (bool): False for requests that must always hit the network.
+            status_group (int): Status of the match, when known, to choose the TTL.
+            start_time (str): Kick-off of the match, scheduled copies expire by then.
+        """
+        if self.replay:
+            body = self.archive.latest('365scores', url, params)
+            if body is None:
+                raise NotArchived('365scores', url)
+            return json.loads(body)
+
+        use_cache = use_cache and self.cache is not None
+        if use_cache:
+            payload = self.cache.get(url, params)
+            if payload is not None:
+                return payload
+
+        response = self._get(url, params=params)
+        if response.status_code != 200:
+            raise Exception(f"Error in {error}: {response.status_code}")
+        payload = response.json()
+        if self.archive is not None:
+            self.archive.put('365scores', url, response.content, params, response.status_code)
+
+        if use_cache:
+            if status_group is not None:
+                ttl = self.cache.ttl_for_status(status_group, start_time)
+            else:
+                ttl = self.cache.ttl_for(payload)
+            self.cache.set(url, params, payload, ttl=ttl)
+        return payload
+
     def _validate_league(self, league, page='365Scores'):
-        possible_leagues = get_possible_leagues_for_page(page)
-        if league not in possible_leagues:
-            raise ValueError(f"League '{league}' is not available. Choose one of: {list(possible_leagues.keys())}")
-        return possible_leagues[league]
+        """League record for a name, id, URL name or alias of the registry."""
+        league_config = registry.get(league, page)
+        if league_config is None:
+            raise ValueError(f"League '{league}' is not available. Choose one of: {get_all_leagues(page)}")
+        return league_config
+
+    def _season_state_path(self, league_id):
+        return self.cache.path / f'season_{league_id}.json' if self.cache else None
+
+    def _load_season_state(self, league_id):
+        """Last snapshot id and games per round of a league, from memory or the cache folder."""
+        if league_id not in self._season_state:
+            path = self._season_state_path(league_id)
+            if path is not None and path.exists():
+                with open(path, encoding='utf-8') as f:
+                    self._season_state[league_id] = json.load(f)
+        return self._season_state.get(league_id)
+
+    def _save_season_state(self, league_id, state):
+        self._season_state[league_id] = state
+        path = self._season_state_path(league_id)
+        if path is not None:
+            write_json(path, state, indent=None)
+
+    def _rounds_to_refresh(self, state, snapshot, round_keys, horizon):
+        """Rounds that can have changed since the stored state was taken.
+
+        Finished rounds never change. Unfinished rounds are refreshed only if
+        they have already started or start within ``horizon``.
+        """
+        if state is None:
+            return round_keys
+        if state['lastUpdateId'] == snapshot:
+            return [rk for rk in round_keys if rk not in state['rounds']]
 
-    def get_all_season_games(self, league, save_data=False, save_json=False):
+        limit = datetime.now(timezone.utc) + horizon
+        stale = []
+        for rk in round_keys:
+            games = state['rounds'].get(rk)
+            if games is None:
+                stale.append(rk)
+            elif all(g.get('statusGroup') == STATUS_FINISHED for g in games):
+                continue
+            elif any(date_parser.parse(g['startTime']) <= limit for g in games):
+                stale.append(rk)
+        return stale
+
+    def _fetch_rounds(self, results_ep, base_params, snapshot, round_keys, on_round=None):
+        """Fetch the games of several rounds concurrently under the shared rate limit.
+
+        ``on_round(round_key, games)`` is called as soon as each round arrives. The
+        rounds are always read from the network: the cache ignores ``lastUpdateId``
+        and would answer a refresh with the copy of an older snapshot.
+        """
+        def fetch(rk):
+            params = {
+                **base_params,
+                'lastUpdateId': snapshot,
+                'roundKey': rk
+            }
+            return self._get_json(results_ep, params=params, error='results request',
+                                  use_cache=False).get('games', [])
+
+        rounds = {}
+        with ThreadPoolExecutor(max_workers=self.transport.max_per_host) as executor:
+            futures = {executor.submit(fetch, rk): rk for rk in round_keys}
+            for future in as_completed(futures):
+                rk = futures[future]
+                rounds[rk] = future.result()
+                if on_round is not None:
+                    on_round(rk, rounds[rk])
+        return rounds
+
+    def _build_schedule(self, games, league_id, url_name):
+        """Season games as a DataFrame sorted by round and kick-off, built column by column."""
+        columns = {k: [] for k in ('roundNum', 'roundName', 'start', 'home_team', 'away_team', 'home_id',
+                                   'away_id', 'home_url', 'away_url', 'match_id', 'status_group')}
+        for g in games:
+            h = g['homeCompetitor']
+            a = g['awayCompetitor']
+            columns['roundNum'].append(g.get('roundNum'))
+            columns['roundName'].append(g.get('roundName'))
+            columns['start'].append(g['startTime'])
+            columns['home_team'].append(h['name'])
+            columns['away_team'].append(a['name'])
+            columns['home_id'].append(h['id'])
+            columns['away_id'].append(a['id'])
+            columns['home_url'].append(h['nameForURL'])
+            columns['away_url'].append(a['nameForURL'])
+            columns['match_id'].append(g['id'])
+            columns['status_group'].append(g.get('statusGroup'))
+        raw = pd.DataFrame(columns)
+
+        # startTime keeps the offset of the game: date and time are read as they come
+        # and the parsed UTC instant is only used to sort.
+        start = raw['start'].astype(str)
+        df = pd.DataFrame({
+            'roundNum': pd.to_numeric(raw['roundNum'], errors='coerce').astype('Int64'),
+            'roundName': raw['roundName'],
+            'match_date': start.str[:10],
+            'start_time': start.str[11:16],
+            'home_team': raw['home_team'],
+            'away_team': raw['away_team'],
+            'home_id': raw['home_id'],
+            'away_id': raw['away_id'],
+            'league_id': league_id,
+            'match_id': raw['match_id'],
+            'status_group': raw['status_group'],
+            'match_url': self._match_urls(url_name, league_id, raw['home_url'], raw['away_url'],
+                                          raw['home_id'], raw['away_id'], raw['match_id']),
+            '_dt': pd.to_datetime(start, utc=True, format='ISO8601'),
+        })
+        return df.sort_values(['roundNum', '_dt']).reset_index(drop=True).drop(columns=['_dt'])
+
+    def get_all_season_games(self, league, save_data=False, save_json=False, incremental=False,
+                             refresh_horizon=timedelta(days=7), compress_json=False):
         """
         Get ALL season games (historical) for a given league.
 
         Args:
             league (str): Name of the league (must exist in get_possible_leagues_for_page()).
             save_data (bool): Save all the games in csv file if True.
-            save_json (bool):  Save raw JSON if True.
+            save_json (bool):  Save the raw games if True, as NDJSON (one game per line)
+                               written while the rounds arrive. Read it back with read_ndjson().
+            incremental (bool): Reuse the rounds of the previous call (kept in memory and in
+                                the cache folder) and only re-fetch the ones that can have
+                                changed: the current round and the upcoming ones.
+            refresh_horizon (timedelta): In incremental mode, upcoming rounds starting later
+                                         than this are not re-fetched.
+            compress_json (bool): Gzip the raw NDJSON dump.
 
         Returns:
             pd.DataFrame: All season games.
         """
         league_config = self._validate_league(league, page='365Scores')
-        league_id = league_config['id']
-        url_name = league_config['URLname']
+        league_id = league_config.id
+        url_name = league_config.url_name
 
         base_url = "https://webws.365scores.com"
         results_ep = f"{base_url}/web/games/results/"
@@ -47,125 +284,215 @@ class Scores365:
             'topBookmaker': 4
         }
 
-        resp0 = requests.get(results_ep, params=base_params)
-        resp0.raise_for_status()
-        data0 = resp0.json()
+        # The round list and snapshot id must always be fresh.
+        data0 = self._get_json(results_ep, params=base_params, error='results request', use_cache=False)
         snapshot = data0['lastUpdateId']
-        round_keys = [rf['key'] for rf in data0.get('roundFilters', []) if rf['key']]
+        round_keys = [str(rf['key']) for rf in data0.get('roundFilters', []) if rf['key']]
+
+        state = self._load_season_state(league_id) if incremental else None
+        rounds = dict(state['rounds']) if state else {}
+        to_fetch = self._rounds_to_refresh(state, snapshot, round_keys, refresh_horizon)
+
+        sink = None
+        if save_json:
+            sink = NDJSONWriter(f'{url_name}_raw_matches.ndjson' + ('.gz' if compress_json else ''))
+            for rk in round_keys:
+                if rk in rounds and rk not in to_fetch:
+                    sink.write_many(rounds[rk])
+        try:
+            on_round = (lambda rk, games: sink.write_many(games)) if sink else None
+            rounds.update(self._fetch_rounds(results_ep, base_params, snapshot, to_fetch, on_round=on_round))
+        finally:
+            if sink:
+                sink.close()
+        self._save_season_state(league_id, {'lastUpdateId': snapshot, 'rounds': rounds})
 
-        all_games = []
+        all_games = [g for rk in round_keys for g in rounds.get(rk, [])]
 
-        for rk in round_keys:
-            params = {
-                **base_params,
-                'lastUpdateId': snapshot,
-                'roundKey': rk
-            }
-            r = requests.get(results_ep, params=params)
-            r.raise_for_status()
-            games = r.json().get('games', [])
-            all_games.extend(games)
+        df = self._build_schedule(all_games, league_id, url_name)
 
-            if save_json:
-                with open(f'{url_name}_raw_matches.json','w',encoding='utf-8') as f:
-                    json.dump(all_games, f, ensure_ascii=False, indent=4)
+        if save_data:
+            df.to_csv(f'{url_name}_matches.csv', index=False)
 
-            time.sleep(0.5)
+        return df
 
-        records = []
-        for g in all_games:
-            h = g['homeCompetitor']
-            a = g['awayCompetitor']
-            dt = date_parser.parse(g['startTime'])
-            records.append({
-                'roundNum': g.get('roundNum'),
-                'roundName': g.get('roundName'),
-                'match_date': dt.strftime("%Y-%m-%d"),
-                'start_time': dt.strftime("%H:%M"),
-                'home_team': h['name'],
-                'away_team': a['name'],
-                'home_id': h['id'],
-                'away_id': a['id'],
-                'league_id': league_id,
-                'match_id': g['id'],
-                'match_url': (
-                    f"https://www.365scores.com/es/football/match/"
-                    f"{url_name}-{league_id}/"
-                    f"{h['nameForURL']}-{a['nameForURL']}-"
-                    f"{h['id']}-{a['id']}-{league_id}"
-                    f"#id={g['id']}"
-                ),
-                '_dt': dt
-            })
+    def _load_manifest(self, path):
+        if path.exists():
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        return {'done': [], 'empty': [], 'failed': {}}
 
-        df = pd.DataFrame.from_records(records)
-        df['roundNum'] = pd.to_numeric(df['roundNum'], errors='coerce')
-        df = df.sort_values(['roundNum', '_dt']).reset_index(drop=True).drop(columns=['_dt'])
+    def _save_manifest(self, path, manifest):
+        write_json(path, manifest)
 
-        if save_data:
-            df.to_csv(f'{url_name}_matches.csv', index=False)
+    def harvest_player_stats(self, league, out_dir='data/raw/365scores', workers=4, retry_failed=True):
+        """
+        Fetch the player stats of every finished match of a league season into a Parquet dataset.
 
-        return df
+        Each match is written as soon as it arrives to
+        ``{out_dir}/player_stats/{URLname}/round={roundNum}/{match_id}.parquet`` (``round=__none__``
+        for games without a round, common in cups) and recorded in ``_manifest.json``. Running it again (after a crash, or later in the
+        season) skips the matches already in the manifest.
 
-    def get_today_games(self, league, save_data=False):
+        Args:
+            league (str): Name of the league (must exist in get_possible_leagues_for_page()).
+            out_dir (str | Path): Root folder of the dataset.
+            workers (int): Matches fetched in parallel.
+            retry_failed (bool): Try again the matches that failed in previous runs.
+
+        Returns:
+            Path: Folder of the dataset, readable with pd.read_parquet().
         """
-            Get all today games for a league
+        league_config = self._validate_league(league, page='365Scores')
+        dataset_path = Path(out_dir) / 'player_stats' / league_config.url_name
+        dataset_path.mkdir(parents=True, exist_ok=True)
+        manifest_path = dataset_path / '_manifest.json'
+        manifest = self._load_manifest(manifest_path)
+
+        games = self.get_all_season_games(league)
+        finished = games[games['status_group'] == STATUS_FINISHED]
+        skip = set(manifest['done']) | set(manifest['empty'])
+        if not retry_failed:
+            skip |= set(manifest['failed'])
+        pending = finished[~finished['match_id'].astype(str).isin(skip)]
+        print(f"[INFO] {len(pending)} of {len(finished)} finished matches pending for {league}.")
+
+        def harvest(row):
+            df = self.get_players_stats(row.match_url)
+            if df.empty:
+                return False
+            round_path = dataset_path / f'round={row.roundNum if pd.notna(row.roundNum) else NO_ROUND}'
+            round_path.mkdir(exist_ok=True)
+            df = df.astype(PLAYER_STATS_SCHEMA)
+            df.to_parquet(round_path / f'{row.match_id}.parquet', index=False)
+            return True
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(harvest, row): str(row.match_id) for row in pending.itertuples()}
+            for future in as_completed(futures):
+                match_id = futures[future]
+                manifest['failed'].pop(match_id, None)
+                try:
+                    manifest['done' if future.result() else 'empty'].append(match_id)
+                except Exception as e:
+                    print(f"[ERROR] Match {match_id} failed: {e}")
+                    manifest['failed'][match_id] = str(e)
+                self._save_manifest(manifest_path, manifest)
+
+        return dataset_path
+
+    def _match_urls(self, url_name, league_id, home_url, away_url, home_id, away_id, match_id):
+        """Build the 365Scores match URLs of many games at once from Series of their parts."""
+        url_name, league_id, home_url, away_url, home_id, away_id, match_id = (
+            pd.Series(part, dtype=object).astype(str) if isinstance(part, pd.Series) else str(part)
+            for part in (url_name, league_id, home_url, away_url, home_id, away_id, match_id)
+        )
+        return ('https://www.365scores.com/es/football/match/' + url_name + '-' + league_id + '/'
+                + home_url + '-' + away_url + '-' + home_id + '-' + away_id + '-' + league_id
+                + '#id=' + match_id)
+
+    def get_today_games(self, league=None, save_data=False, leagues=None, batch_size=10, use_cache=True):
+        """
+            Get all today games for one or several leagues
 
             Args:
             league (str): Possible leagues in get_available_leagues("365Scores").
                           The page don't show stats from previous seasons.
+            leagues (list): Several leagues at once, in place of ``league``. Their ids
+                            are sent together, ``batch_size`` per request.
+            batch_size (int): Max competitions per request.
+            use_cache (bool): False to always read the games from the network (pollers).
 
             Returns:
-                df: DataFrame with all the games.
+                df: DataFrame with all the games and the league of each one.
         """
-        league_config = self._validate_league(league)
-        league_id = league_config['id']
-        url_name = league_config['URLname']
-        print(league_id)
-        print(url_name)
-
-        url = f'https://webws.365scores.com/web/games/?appTypeId=5&langId=29&competitions={league_id}'
-        response = requests.get(url, headers=self.headers)
-        if response.status_code != 200:
-            raise Exception(f"Error in competitions request: {response.status_code}")
-        data = response.json()
+        if leagues is None:
+            if league is None:
+                raise ValueError("Give a league or a list of leagues.")
+            leagues = [league]
+        elif isinstance(leagues, str):
+            leagues = [leagues]
+
+        league_configs = {}
+        for name in leagues:
+            league_config = self._validate_league(name)
+            league_configs[league_config.id] = (league_config.name, league_config.url_name)
+        league_ids = list(league_configs)
+
+        games, update_ids = [], []
+        for i in range(0, len(league_ids), batch_size):
+            competitions = ','.join(str(league_id) for league_id in league_ids[i:i + batch_size])
+            url = f'https://webws.365scores.com/web/games/?appTypeId=5&langId=29&competitions={competitions}'
+            data = self._get_json(url, error='competitions request', use_cache=use_cache)
+            games.extend(data.get('games', []))
+            update_ids.append(data.get('lastUpdateId'))
 
         if save_data:
-            with open(f'today_games{league}.json', 'w') as json_file:
-                json.dump(data, json_file, indent=4)
-
-        games = data['games']
-        today = datetime.now().date()
-        match_list = []
+            file_name = f'today_games{leagues[0]}.json' if len(leagues) == 1 else 'today_games.json'
+            with open(file_name, 'w') as json_file:
+                json.dump({'games': games}, json_file, indent=4)
 
+        default_id = league_ids[0] if len(league_ids) == 1 else None
+        columns = {k: [] for k in ('home_team', 'away_team', 'start', 'home_url', 'away_url',
+                                   'home_id', 'away_id', 'league_id', 'match_id', 'status_group')}
         for game in games:
-            game_datetime = datetime.fromisoformat(game['startTime'].replace('Z', '+00:00'))
-            game_date = game_datetime.date()
-
-            if game_date == today:
-                home = game['homeCompetitor']
-                away = game['awayCompetitor']
-                match_url = f"https://www.365scores.com/es/football/match/{url_name}-{league_id}/{home['nameForURL']}-{away['nameForURL']}-{home['id']}-{away['id']}-{league_id}#id={game['id']}"
-                match_list.append({
-                    'home_team': home['name'],
-                    'away_team': away['name'],
-                    'start_time': game_datetime.strftime("%H:%M"),
-                    'match_url': match_url,
-                    'home_id': home['id'],
-                    'away_id': away['id'],
-                    'league_id': league_id,
-                    'match_id': game['id']
-                })
-
-        return pd.DataFrame(match_list)
-
-    def _parse_dataframe(self, obj):
-        df = pd.DataFrame(obj['rows'])
-        df_1 = df['entity'].apply(pd.Series)
-        df_2 = df['stats'].apply(pd.Series)[0].apply(pd.Series)
-        df_concat = pd.concat([df_1, df_2], axis=1)[['id', 'name', 'positionName', 'value']]
-        df_concat['estadistica'] = obj['name']
-        return df_concat
+            home = game['homeCompetitor']
+            away = game['awayCompetitor']
+            columns['home_team'].append(home['name'])
+            columns['away_team'].append(away['name'])
+            columns['start'].append(game['startTime'])
+            columns['home_url'].append(home['nameForURL'])
+            columns['away_url'].append(away['nameForURL'])
+            columns['home_id'].append(home['id'])
+            columns['away_id'].append(away['id'])
+            columns['league_id'].append(game.get('competitionId', default_id))
+            columns['match_id'].append(game['id'])
+            columns['status_group'].append(game.get('statusGroup'))
+        raw = pd.DataFrame(columns).drop_duplicates('match_id')
+
+        # startTime keeps the offset of the game, its first 10 chars are the local date
+        start = raw['start'].astype(str)
+        raw = raw[start.str[:10] == datetime.now().date().isoformat()].reset_index(drop=True)
+        start = raw['start'].astype(str)
+
+        url_name = raw['league_id'].map(lambda i: league_configs.get(i, (None, ''))[1])
+        df = pd.DataFrame({
+            'home_team': raw['home_team'],
+            'away_team': raw['away_team'],
+            'start_time': start.str[11:16],
+            'match_url': self._match_urls(url_name, raw['league_id'], raw['home_url'], raw['away_url'],
+                                          raw['home_id'], raw['away_id'], raw['match_id']),
+            'home_id': raw['home_id'],
+            'away_id': raw['away_id'],
+            'league_id': raw['league_id'],
+            'league': raw['league_id'].map(lambda i: league_configs.get(i, (None, ''))[0]),
+            'match_id': raw['match_id'],
+            'status_group': raw['status_group'],
+        })
+        df.attrs['lastUpdateId'] = update_ids[0] if len(update_ids) == 1 else tuple(update_ids)
+        return df
+
+    def _parse_athletes_stats(self, athletes_stats):
+        """Flatten ``athletesStats`` in one pass into columns and build a single DataFrame."""
+        ids, names, positions, values, stat_names = [], [], [], [], []
+        for obj in athletes_stats:
+            stat_name = obj.get('name')
+            for row in obj.get('rows', []):
+                entity = row.get('entity', {})
+                stats = row.get('stats') or [{}]
+                ids.append(entity.get('id'))
+                names.append(entity.get('name'))
+                positions.append(entity.get('positionName'))
+                values.append(stats[0].get('value'))
+                stat_names.append(stat_name)
+
+        return pd.DataFrame({
+            'id': pd.array(ids, dtype='Int64'),
+            'name': names,
+            'positionName': pd.Categorical(positions),
+            'value': pd.to_numeric(pd.Series(values, dtype=object), errors='coerce'),
+            'estadistica': pd.Categorical(stat_names),
+        })
 
     def get_league_top_scorers(self, league, save_data=False):
         """Get top performers of certain statistics for a league and a season
@@ -178,24 +505,17 @@ class Scores365:
             df: DataFrame with all the stats, values and players.
         """
         league_config = self._validate_league(league, page='365Scores')
-        league_id = league_config['id']
-        #url_name = league_config['URLname']
+        league_id = league_config.id
+        #url_name = league_config.url_name
 
         url = f'https://webws.365scores.com/web/stats/?appTypeId=5&langId=29&timezoneName=America/Bogota&userCountryId=170&competitions={league_id}&competitors=&withSeasons=true'
-        response = requests.get(url, headers=self.headers)
-        time.sleep(2)
-        stats = response.json()['stats']
+        stats = self._get_json(url, error='stats request')['stats']
 
         if save_data:
             with open(f'general_stats_{league}.json', 'w') as json_file:
                 json.dump(stats, json_file, indent=4)
 
-        athlete = stats['athletesStats']
-        df = pd.DataFrame()
-        for obj in athlete:
-            stats_df = self._parse_dataframe(obj)
-            df = pd.concat([df, stats_df])
-        return df
+        return self._parse_athletes_stats(stats['athletesStats'])
 
     def _get_ids(self, match_url):
         """Extracts matchup_id and game_id from match URL."""
@@ -204,11 +524,19 @@ class Scores365:
         return (matchup_match.group(1) if matchup_match else None,
                 game_match.group(1) if game_match else None)
 
-    def get_match_data(self, match_url, save_data=False):
+    def get_match_bundle(self, match_url):
+        """Get a MatchBundle that fetches the match payloads only once."""
+        return MatchBundle(self, match_url)
+
+    def _as_bundle(self, match):
+        return match if isinstance(match, MatchBundle) else self.get_match_bundle(match)
+
+    def get_match_data(self, match_url, save_data=False, use_cache=True):
         """Fetch complete match data from 365Scores.
         Args:
             match_url: Link of the game
             save_data: To save the json data. Default is False
+            use_cache: False to always read the match from the network (pollers).
         
         Returns:
             match_data: Json with all the stats from a match"""
@@ -218,12 +546,7 @@ class Scores365:
             raise ValueError("Fail to extract matchup_id or game_id.")
 
         url = f'https://webws.365scores.com/web/game/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&gameId={game_id}&matchupId={matchup_id}&topBookmaker=14'
-        response = requests.get(url, headers=self.headers)
-        if response.status_code != 200:
-            raise Exception(f"Error in request: {response.status_code}")
-
-        time.sleep(2)
-        match_data = response.json()['game']
+        match_data = self._get_json(url, use_cache=use_cache)['game']
 
         if save_data:
             with open(f'match_stats_{game_id}.json', 'w') as json_file:
@@ -231,28 +554,36 @@ class Scores365:
 
         return match_data
 
-    def get_match_stats(self, game_id):
-        """Fetch statistics for a match from 365Scores."""
-        url = f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}'
-        response = requests.get(url, headers=self.headers)
-        if response.status_code != 200:
-            raise Exception(f"Error in stats request: {response.status_code}")
+    def get_match_stats(self, game_id, status_group=None, start_time=None, use_cache=True):
+        """Fetch statistics for a match from 365Scores.
 
-        time.sleep(2)
-        return response.json()
+        Args:
+            game_id: Id of the game.
+            status_group (int): statusGroup of the match if known, so finished
+                                matches are cached for good. Unknown is cached as live.
+            start_time (str): Kick-off of the match if known, so a scheduled one isn't
+                              cached past it.
+            use_cache (bool): False to always read the stats from the network (pollers).
+        """
+        url = f'https://webws.365scores.com/web/game/stats/?appTypeId=5&langId=29&timezoneName=America/Buenos_Aires&userCountryId=382&games={game_id}'
+        # The stats payload doesn't say the status of the match, assume the worst
+        if status_group is None:
+            status_group = STATUS_LIVE
+        return self._get_json(url, error='stats request', status_group=status_group, start_time=start_time,
+                              use_cache=use_cache)
 
     def extract_statistics(self, match_url):
         """
         Extract and organize match statistics into a DataFrame.
 
         Args:
-            match_url (str): URL of the match on 365Scores.
+            match_url (str | MatchBundle): URL of the match on 365Scores.
 
         Returns:
             df_stats (DataFrame): Organized DataFrame with real team names.
         """
-        matchup_id, game_id = self._get_ids(match_url)
-        match_data = self.get_match_data(match_url)
+        bundle = self._as_bundle(match_url)
+        match_data = bundle.data
 
         try:
             status_group = match_data['statusGroup']
@@ -263,7 +594,7 @@ class Scores365:
         stats_dict = {}
 
         if status_group in [3, 4]:
-            stats_data = self.get_match_stats(game_id)
+            stats_data = bundle.stats
             try:
                 statistics = stats_data['statistics']
                 competitors = stats_data['competitors']
@@ -328,72 +659,141 @@ class Scores365:
         """Get players info for a certain match
 
         Args:
-            match_url (url): 365Scores match URL
+            match_url (url | MatchBundle): 365Scores match URL
 
         Returns:
             teams_df: Player data for a match as a DataFrame.
         """
-        match_dt = self.get_match_data(match_url)
-        teams = match_dt['members']
-        team_df = pd.DataFrame(teams)
-        matchup_id, game_id = self._get_ids(match_url)
+        bundle = self._as_bundle(match_url)
+        team_df = bundle.players()
         if save_data:
-            team_df.to_csv(f'players_data_{game_id}.csv', index=False)
+            team_df.to_csv(f'players_data_{bundle.game_id}.csv', index=False)
         return team_df
 
-    def get_players_stats(self, match_url, save_data=False, save_json=False):
+    def get_match_events(self, match_url, save_data=False):
+        """Get the events (goals, cards, substitutions...) of a match.
+
+        Args:
+            match_url (url | MatchBundle): 365Scores match URL
+            save_data (bool): Save the events to a CSV file.
+
+        Returns:
+            events_df: One row per event with the team and player names.
+        """
+        bundle = self._as_bundle(match_url)
+        match_data = bundle.data
+        events_df = pd.json_normalize(bundle.events())
+        if events_df.empty:
+            return events_df
+
+        teams = {match_data[side]['id']: match_data[side]['name']
+                 for side in ['homeCompetitor', 'awayCompetitor'] if side in match_data}
+        players = {m.get('id'): m.get('name') for m in match_data.get('members', [])}
+        if 'competitorId' in events_df:
+            events_df['team'] = events_df['competitorId'].map(teams)
+        if 'playerId' in events_df:
+            events_df['player_name'] = events_df['playerId'].map(players)
+
+        if save_data:
+            events_df.to_csv(f'match_events_{bundle.game_id}.csv', index=False)
+        return events_df
+
+    def _parse_stat_values(self, values):
+        """Numeric part of stat values like '7.2', '85%' or '3/5 (60%)' as float32 (NaN if none)."""
+        numbers = pd.Series(values, dtype='string').str.extract(r'(-?\d+(?:\.\d+)?)', expand=False)
+        return numbers.astype('float32').to_numpy(na_value=np.nan)
+
+    def get_players_stats(self, match_url, save_data=False, save_json=False, wide=False):
         """
         Extract all general statistics for all players in a match.
 
         Args:
-            match_url (str): Match URL from 365Scores.
+            match_url (str | MatchBundle): Match URL from 365Scores.
             save_data (bool): Save the data to a CSV file.
+            wide (bool): Return a player x stat float32 matrix (numeric part of every
+                         value) instead of one row per player and stat.
 
         Returns:
             pd.DataFrame: Player statistics for the match.
         """
-        match_data = self.get_match_data(match_url)
-        matchup_id, game_id = self._get_ids(match_url)
+        bundle = self._as_bundle(match_url)
+        match_data = bundle.data
+        game_id = bundle.game_id
 
         if not match_data.get('hasLineups'):
             print(f"[INFO] Match {game_id} has no lineups. Skipping individual stats.")
             return pd.DataFrame()
 
         # Search all players info to map names and positions
-        players_info_df = self.get_players(match_url, save_data=False)
-        id_to_name = dict(zip(players_info_df['id'], players_info_df['name']))
-        id_to_position = {
-            row['id']: row.get('position', {}).get('name') for _, row in players_info_df.iterrows()
-        }
+        id_to_name = {}
+        id_to_position = {}
+        for member in match_data.get('members', []):
+            id_to_name[member.get('id')] = member.get('name')
+            id_to_position[member.get('id')] = (member.get('position') or {}).get('name')
 
-        rows = []
+        teams, player_ids, stat_names, values = [], [], [], []
         for side in ['homeCompetitor', 'awayCompetitor']:
             team = match_data.get(side, {})
             team_name = team.get('name', 'Unknown')
             players = team.get('lineups', {}).get('members', [])
 
             for p in players:
-                player_id = p.get('id')
-                player_name = id_to_name.get(player_id, 'Unknown')
-                position = id_to_position.get(player_id, None)
                 stats = p.get('stats', [])
-
+                teams.extend([team_name] * len(stats))
+                player_ids.extend([p.get('id')] * len(stats))
                 for stat in stats:
-                    stat_name = stat.get('name')
-                    value = stat.get('value')
-                    rows.append({
-                        'match_id': game_id,
-                        'team': team_name,
-                        'player_id': player_id,
-                        'player_name': player_name,
-                        'position': position,
-                        'stat_name': stat_name,
-                        'value': value
-                    })
-
-        df = pd.DataFrame(rows)
+                    stat_names.append(stat.get('name'))
+                    values.append(stat.get('value'))
+
+        player_names = [id_to_name.get(pid, 'Unknown') for pid in player_ids]
+        positions = [id_to_position.get(pid) for pid in player_ids]
+
+        if wide:
+            df = self._players_stats_matrix(game_id, teams, player_ids, player_names, positions, stat_names, values)
+        else:
+            df = pd.DataFrame({
+                'match_id': game_id,
+                'team': pd.Categorical(teams),
+                'player_id': player_ids,
+                'player_name': pd.Categorical(player_names),
+                'position': pd.Categorical(positions),
+                'stat_name': pd.Categorical(stat_names),
+                'value': values
+            })
 
         if save_data:
-            df.to_csv(f'full_individual_stats_{game_id}.csv', index=False)
+            df.to_csv(f'full_individual_stats_{game_id}.csv', index=wide)
 
-        return df
\ No newline at end of file
+        return df
+
+    def _players_stats_matrix(self, game_id, teams, player_ids, player_names, positions, stat_names, values):
+        """Scatter the long player stats into a player x stat float32 matrix.
+
+        Stats of members without an id, or without a stat name, are left out: they
+        have no cell in the matrix (factorize would give them code -1, which writes
+        into the last row or column).
+        """
+        keep = pd.notna(pd.Series(player_ids, dtype=object)).to_numpy() & \
+            pd.notna(pd.Series(stat_names, dtype=object)).to_numpy()
+        if not keep.all():
+            print(f"[INFO] Match {game_id}: {int((~keep).sum())} stats without player id or name left out.")
+            teams, player_ids, player_names, positions, stat_names, values = (
+                [x for x, k in zip(column, keep) if k]
+                for column in (teams, player_ids, player_names, positions, stat_names, values))
+
+        player_codes, unique_players = pd.factorize(pd.Series(player_ids, dtype=object))
+        stat_codes, unique_stats = pd.factorize(pd.Series(stat_names, dtype=object))
+
+        matrix = np.full((len(unique_players), len(unique_stats)), np.nan, dtype=np.float32)
+        matrix[player_codes, stat_codes] = self._parse_stat_values(values)
+
+        # First occurrence of every player gives its team, name and position
+        first = np.unique(player_codes, return_index=True)[1]
+        index = pd.MultiIndex.from_arrays([
+            np.full(len(unique_players), game_id, dtype=object),
+            pd.Categorical(np.asarray(teams, dtype=object)[first]),
+            unique_players,
+            pd.Categorical(np.asarray(player_names, dtype=object)[first]),
+            pd.Categorical(np.asarray(positions, dtype=object)[first]),
+        ], names=['match_id', 'team', 'player_id', 'player_name', 'position'])
+        return pd.DataFrame(matrix, index=index, columns=pd.Index(unique_stats, name='stat_name'))
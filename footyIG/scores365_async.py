@@ -0,0 +1,86 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from footyIG.scores365 import Scores365
+
+
+class Scores365Async:
+    """Asyncio front end of Scores365 with bulk fetch methods.
+
+    The calls of a Scores365 client run on a thread pool, at most ``concurrency``
+    at a time, and are awaited from asyncio; the HTTP itself stays the sync pooled
+    transport. The rate limiter is shared with that client, so mixing sync and
+    async calls keeps the same politeness.
+
+    Args:
+        concurrency (int): Max requests in flight at the same time.
+        client (Scores365): Sync client to reuse, left open by ``close``. A new one is created if None.
+        limiter (RateLimiter): Limiter for the new client, ignored if ``client`` is given.
+    """
+
+    def __init__(self, concurrency=8, client=None, limiter=None):
+        self.concurrency = concurrency
+        self._owns_client = client is None
+        self.client = client or Scores365(max_per_host=concurrency, limiter=limiter)
+        self.limiter = self.client.limiter
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='scores365')
+
+    async def _run(self, func, *args):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _many(self, func, items, return_exceptions):
+        tasks = [self._run(func, item) for item in items]
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+
+    async def get_match_data(self, match_url):
+        return await self._run(self.client.get_match_data, match_url)
+
+    async def get_match_stats(self, game_id):
+        return await self._run(self.client.get_match_stats, game_id)
+
+    async def get_all_season_games(self, league):
+        return await self._run(self.client.get_all_season_games, league)
+
+    async def get_match_data_many(self, urls, return_exceptions=False):
+        """Fetch match data for several matches concurrently.
+
+        Args:
+            urls (list): 365Scores match URLs.
+            return_exceptions (bool): Return the exception in place of the data for
+                                      failed matches instead of raising the first one.
+
+        Returns:
+            list: Match data in the same order as ``urls``.
+        """
+        return await self._many(self.client.get_match_data, urls, return_exceptions)
+
+    async def get_match_stats_many(self, game_ids, return_exceptions=False):
+        """Fetch the statistics of several matches concurrently.
+
+        Returns:
+            list: Stats payloads in the same order as ``game_ids``.
+        """
+        return await self._many(self.client.get_match_stats, game_ids, return_exceptions)
+
+    async def get_all_season_games_many(self, leagues, return_exceptions=False):
+        """Fetch all the season games for several leagues concurrently.
+
+        Returns:
+            dict: ``{league: DataFrame}`` with the season games of every league.
+        """
+        results = await self._many(self.client.get_all_season_games, leagues, return_exceptions)
+        return dict(zip(leagues, results))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
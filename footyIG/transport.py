@@ -0,0 +1,69 @@
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .ratelimit import THROTTLE_STATUS, RateLimiter, parse_retry_after
+
+
+class Transport:
+    """Pooled HTTP transport shared by all the requests of a scraper instance.
+
+    Keeps one ``requests.Session`` with keep-alive connections so consecutive
+    calls to the same host reuse warm TCP+TLS connections instead of opening a
+    new one every time. The session is shared between threads; the connection
+    pool of each host is bounded by ``max_per_host``. Every request waits for
+    the ``limiter`` and throttled responses (429/503) are retried after the
+    limiter has backed off.
+
+    Args:
+        headers (dict): Default headers sent with every request.
+        pool_size (int): Number of hosts whose connection pools are kept alive.
+        max_per_host (int): Max open connections per host.
+        timeout (float | tuple): Default (connect, read) timeout in seconds.
+        limiter (RateLimiter): Limiter shared by every request. A default one is created if None.
+        retries (int): Times a throttled request is retried.
+    """
+
+    def __init__(self, headers=None, pool_size=10, max_per_host=10, timeout=(5, 30), limiter=None, retries=3):
+        self.timeout = timeout
+        self.limiter = limiter or RateLimiter()
+        self.retries = retries
+        self.pool_size = pool_size
+        self.max_per_host = max_per_host
+
+        self.session = requests.Session()
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+        if headers:
+            self.session.headers.update(headers)
+
+        # pool_block makes threads wait for a free connection instead of
+        # opening extra ones, which is what enforces the per-host limit.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=max_per_host, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    @staticmethod
+    def host(url):
+        return urlparse(url).netloc
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        """GET ``url`` through the pooled session, respecting the rate limiter."""
+        host = self.host(url)
+        for attempt in range(self.retries + 1):
+            self.limiter.acquire(host)
+            response = self.session.get(url, params=params, headers=headers, timeout=timeout or self.timeout)
+            retry_after = parse_retry_after(response.headers.get('Retry-After'))
+            self.limiter.update(host, response.status_code, retry_after)
+            if response.status_code not in THROTTLE_STATUS or attempt == self.retries:
+                return response
+            response.close()
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()